@@ -9,8 +9,8 @@ Usage:
     python convert_to_ico.py
 """
 
-import os
-from PIL import Image
+from create_ico import create_ico_with_png
+from iconpipeline import read_source
 
 # Configuration
 INPUT_PNG = "src-tauri/icons/icon.png"
@@ -27,45 +27,25 @@ def convert_png_to_ico():
     print("[SYSTEM:AUTHOR] Wildflower")
     print("=" * 60)
     
-    # Check if input file exists
-    if not os.path.exists(INPUT_PNG):
+    print(f"\n[INPUT:FILE] Loading {INPUT_PNG}")
+    
+    # Only the input read decides "not found" - pipeline errors are reported below
+    try:
+        source = read_source(INPUT_PNG)
+    except FileNotFoundError:
         print(f"\n[ERROR:FILE] Input file not found: {INPUT_PNG}")
         return
     
-    print(f"\n[INPUT:FILE] Loading {INPUT_PNG}")
-    
     try:
-        # Open source image
-        with Image.open(INPUT_PNG) as img:
-            print(f"[INPUT:INFO] Image size: {img.size}, Mode: {img.mode}")
-            
-            # Convert to RGBA if necessary
-            if img.mode != 'RGBA':
-                print(f"[CONVERT:MODE] Converting {img.mode} to RGBA")
-                img = img.convert('RGBA')
-            
-            # Create list of resized images for ICO
-            print(f"\n[ICON:RESIZE] Creating {len(ICO_SIZES)} sizes")
-            ico_images = []
-            for size in ICO_SIZES:
-                resized = img.resize(size, Image.Resampling.LANCZOS)
-                ico_images.append(resized)
-                print(f"[ICON:SIZE] Generated {size[0]}x{size[1]}")
-            
-            # Save as ICO
-            print(f"\n[ICON:SAVE] Saving to {OUTPUT_ICO}")
-            ico_images[0].save(
-                OUTPUT_ICO,
-                format="ICO",
-                sizes=ICO_SIZES,
-                append_images=ico_images[1:]
-            )
-            
-            print("\n" + "=" * 60)
-            print("[SYSTEM:SUCCESS] ICO conversion completed")
-            print(f"[OUTPUT:FILE] {OUTPUT_ICO}")
-            print(f"[OUTPUT:SIZES] {len(ICO_SIZES)} embedded sizes")
-            print("=" * 60)
+        # Resize and pack through the shared ICO writer (PNG entries)
+        print(f"\n[ICON:RESIZE] Creating {len(ICO_SIZES)} sizes")
+        create_ico_with_png(INPUT_PNG, OUTPUT_ICO, [width for width, _ in ICO_SIZES], source)
+        
+        print("\n" + "=" * 60)
+        print("[SYSTEM:SUCCESS] ICO conversion completed")
+        print(f"[OUTPUT:FILE] {OUTPUT_ICO}")
+        print(f"[OUTPUT:SIZES] {len(ICO_SIZES)} embedded sizes")
+        print("=" * 60)
             
     except Exception as e:
         print(f"\n[ERROR:EXCEPTION] {str(e)}")
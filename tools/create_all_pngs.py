@@ -5,16 +5,19 @@ Description: Creates all PNG sizes needed for Tauri from login_icon.jpg
 Language: Python 3.x
 """
 
-from PIL import Image
 import os
+from iconpipeline import downscale, encode_png
+from imagecache import load_rgba
 
-source = Image.open('login_icon.jpg').convert('RGBA')
+
+source = load_rgba('login_icon.jpg')
 output_dir = 'src-tauri/icons'
 
 for size in [16, 24, 48, 64]:
-    resized = source.resize((size, size), Image.Resampling.LANCZOS)
+    resized = downscale(source, size)
     path = os.path.join(output_dir, f'{size}x{size}.png')
-    resized.save(path, 'PNG', optimize=True)
+    with open(path, 'wb') as f:
+        f.write(encode_png(resized, compress_level=6))
     print(f'[PNG] Created: {path}')
 
 print('[DONE] All PNG sizes created')
@@ -6,8 +6,11 @@ Language: Python
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+import numpy as np
 import os
 import sys
+from iconpipeline import downscale
+from imagecache import load_rgba
 
 # ============================================================================
 # CONFIGURATION
@@ -20,6 +23,7 @@ CONFIG = {
     'sizes': [16, 24, 32, 48, 64, 128, 256],  # All sizes for ICO
     'border_color_primary': (220, 140, 170),    # Light rose/pink
     'border_color_secondary': (180, 110, 145),  # Medium rose
+    'master_mask_size': 1024,                   # Supersampled circle mask
 }
 
 # ============================================================================
@@ -30,11 +34,17 @@ def create_circular_icon(input_path, output_dir, sizes):
     """Creates circular icons with gradient border"""
     print(f'[ICON-INIT] Loading source image: {input_path}')
     
-    original = Image.open(input_path).convert('RGBA')
+    original = load_rgba(input_path)
     print(f'[ICON-INFO] Source size: {original.size[0]}x{original.size[1]}')
     
     generated_images = {}
     
+    # Circular mask rasterized once at high resolution; each size downsamples
+    # it, which also gives smoother anti-aliased edges on small icons
+    master_size = CONFIG['master_mask_size']
+    master_mask = Image.new('L', (master_size, master_size), 0)
+    ImageDraw.Draw(master_mask).ellipse([0, 0, master_size - 1, master_size - 1], fill=255)
+    
     for size in sizes:
         print(f'[ICON-PROCESS] Generating {size}x{size} icon...')
         
@@ -42,39 +52,34 @@ def create_circular_icon(input_path, output_dir, sizes):
         border_width = max(2, size // 20)
         glow_size = max(2, size // 20)
         
-        # Create canvas with extra space for glow
+        # Canvas with extra space for glow
         canvas_size = size + (glow_size * 2)
-        canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(canvas)
-        
         center = canvas_size // 2
         radius = (size // 2) - 1
         
-        # Draw outer glow effect
-        for i in range(glow_size, 0, -1):
-            glow_radius = radius + border_width + i
-            alpha = int(60 * (1 - i / glow_size))
-            draw.ellipse(
-                [center - glow_radius, center - glow_radius, 
-                 center + glow_radius, center + glow_radius],
-                outline=(*CONFIG['border_color_primary'][:3], alpha),
-                width=2
-            )
+        # Radial distance of every canvas pixel from the center
+        yy, xx = np.ogrid[:canvas_size, :canvas_size]
+        dist = np.hypot(xx - center, yy - center).astype(np.float32)
+        ring = np.rint(dist)
         
-        # Draw gradient border (outer to inner)
-        for i in range(border_width):
-            ratio = i / max(1, border_width - 1)
-            r = int(CONFIG['border_color_primary'][0] * (1 - ratio) + CONFIG['border_color_secondary'][0] * ratio)
-            g = int(CONFIG['border_color_primary'][1] * (1 - ratio) + CONFIG['border_color_secondary'][1] * ratio)
-            b = int(CONFIG['border_color_primary'][2] * (1 - ratio) + CONFIG['border_color_secondary'][2] * ratio)
-            
-            current_radius = radius - i
-            draw.ellipse(
-                [center - current_radius, center - current_radius, 
-                 center + current_radius, center + current_radius],
-                outline=(r, g, b, 255),
-                width=1
-            )
+        pixels = np.zeros((canvas_size, canvas_size, 4), dtype=np.uint8)
+        primary = np.array(CONFIG['border_color_primary'][:3], dtype=np.float32)
+        secondary = np.array(CONFIG['border_color_secondary'][:3], dtype=np.float32)
+        
+        # Outer glow effect - alpha fades out with distance past the border
+        glow_band = dist > radius + border_width
+        glow_alpha = np.clip(60 * (1 - (dist - radius - border_width) / glow_size), 0, 60)
+        pixels[glow_band, :3] = primary.astype(np.uint8)
+        pixels[glow_band, 3] = glow_alpha[glow_band].astype(np.uint8)
+        
+        # Gradient border (outer to inner) - one LUT color per ring
+        border_band = (ring <= radius) & (ring > radius - border_width)
+        ramp = np.linspace(primary, secondary, max(1, border_width)).astype(np.uint8)
+        pixels[border_band, :3] = ramp[(radius - ring)[border_band].astype(np.intp)]
+        pixels[border_band, 3] = 255
+        
+        canvas = Image.fromarray(pixels, 'RGBA')
+        draw = ImageDraw.Draw(canvas)
         
         # Inner accent line
         inner_radius = radius - border_width - 1
@@ -90,13 +95,12 @@ def create_circular_icon(input_path, output_dir, sizes):
         mask_size = mask_radius * 2
         
         if mask_size > 0:
-            mask = Image.new('L', (mask_size, mask_size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.ellipse([0, 0, mask_size - 1, mask_size - 1], fill=255)
+            mask = master_mask.resize((mask_size, mask_size), Image.Resampling.LANCZOS)
             
-            # Resize original image to fit inside circle
-            img_resized = original.resize((mask_size, mask_size), Image.Resampling.LANCZOS)
-            img_resized.putalpha(mask)
+            # Resize original image to fit inside circle, mask goes straight into alpha
+            img_pixels = np.array(downscale(original, mask_size))
+            img_pixels[..., 3] = np.asarray(mask)
+            img_resized = Image.fromarray(img_pixels, 'RGBA')
             
             # Paste image onto canvas
             paste_pos = (center - mask_radius, center - mask_radius)
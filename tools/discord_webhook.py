@@ -7,16 +7,52 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import functools
+import gzip
 import json
 import os
-from dataclasses import dataclass
-from typing import Optional, List
+import sys
+from pathlib import Path
+from typing import Optional, List, Tuple
 from colorama import init, Fore, Style
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Initialize colorama for Windows CMD support
 init(autoreset=True)
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes - orjson when installed, stdlib json otherwise"""
+    if orjson is None:
+        return json.dumps(obj).encode()
+    return orjson.dumps(obj)
+
+
+def _encode_body(payload: bytes) -> Tuple[bytes, dict]:
+    """Gzip JSON bodies above GZIP_MIN_SIZE and return them with matching headers"""
+    headers = {"Content-Type": "application/json"}
+    if len(payload) > GZIP_MIN_SIZE:
+        payload = gzip.compress(payload, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return payload, headers
+
+
 # [CONFIG] Webhook and download settings
 # IMPORTANT: Replace with your own Discord webhook URL
 # Create at: Discord Server Settings > Integrations > Webhooks
@@ -30,17 +66,13 @@ MEDIAFIRE_URL = "YOUR_MEDIAFIRE_URL"
 GOOGLE_DRIVE_URL = "YOUR_GOOGLE_DRIVE_URL"
 DROPBOX_URL = "YOUR_DROPBOX_URL"
 
+# [CONFIG] JSON bodies larger than this are sent gzip-compressed
+GZIP_MIN_SIZE = 512
+
 # [CONFIG] Banner paths
 BANNER_URL = "https://i.ibb.co/vxLHqjyM/download-banner.png"
-BANNER_LOCAL_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'assets', 'discord', 'download_banner.png')
-
-
-@dataclass
-class EmbedField:
-    """Embed field structure"""
-    name: str
-    value: str
-    inline: bool = True
+DISCORD_DIR = Path(__file__).resolve().parent.parent / 'public' / 'assets' / 'discord'
+BANNER_LOCAL_PATH = str(DISCORD_DIR / 'download_banner.png')
 
 
 class DiscordWebhook:
@@ -56,8 +88,9 @@ class DiscordWebhook:
     
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
+        # Keep-alive session shared by JSON and multipart sends - one TLS handshake per run
         self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
     
     def _log(self, tag: str, message: str, color: str = Fore.WHITE) -> None:
         """Professional logging output"""
@@ -90,45 +123,7 @@ class DiscordWebhook:
             bool: Success status
         """
         
-        # Single embed with inline fields - 2x2 grid layout
-        main_embed = {
-            "color": self.COLOR_PINK,
-            "title": "UPDATE 0.0.3",
-            "description": "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "fields": [
-                {
-                    "name": "Directly",
-                    "value": f"**[Click to Install]({direct_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "MediaFire",
-                    "value": f"**[Click to Install]({mediafire_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Google Drive",
-                    "value": f"**[Click to Install]({gdrive_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Dropbox",
-                    "value": f"**[Click to Install]({dropbox_url})**",
-                    "inline": True
-                }
-            ],
-            "image": {"url": banner_url},
-            "footer": {
-                "text": "Wildflover › Windows 10/11"
-            }
-        }
-        
-        payload = {
-            "username": "Wildflover",
-            "embeds": [main_embed]
-        }
-        
-        return self._send(payload)
+        return self._send(self._build_payload("install", banner_url, direct_url, mediafire_url, gdrive_url, dropbox_url))
     
     def send_minimal_install(self, banner_url: str, direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> bool:
         """
@@ -145,42 +140,7 @@ class DiscordWebhook:
             bool: Success status
         """
         
-        embed = {
-            "color": self.COLOR_PINK,
-            "title": "UPDATE 0.0.3",
-            "description": "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "fields": [
-                {
-                    "name": "Directly",
-                    "value": f"**[Click to Install]({direct_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "MediaFire",
-                    "value": f"**[Click to Install]({mediafire_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Google Drive",
-                    "value": f"**[Click to Install]({gdrive_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Dropbox",
-                    "value": f"**[Click to Install]({dropbox_url})**",
-                    "inline": True
-                }
-            ],
-            "image": {"url": banner_url},
-            "footer": {"text": "Wildflover • Windows 10/11"}
-        }
-        
-        payload = {
-            "username": "Wildflover",
-            "embeds": [embed]
-        }
-        
-        return self._send(payload)
+        return self._send(self._build_payload("minimal", banner_url, direct_url, mediafire_url, gdrive_url, dropbox_url))
     
     def send_banner_text_only(self, direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> bool:
         """
@@ -197,51 +157,7 @@ class DiscordWebhook:
             bool: Success status
         """
         
-        embed = {
-            "color": self.COLOR_PINK,
-            "title": "Wildflover",
-            "description": (
-                "*League of Legends Skin Manager*\n"
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                "`Wildflover` `Windows 10/11`\n\n"
-                "› **All Skins Unlocked** / Tüm Skinler Açık\n"
-                "› **Safe & Undetectable** / Güvenli & Tespit Edilemez\n"
-                "› **Auto Updates** / Otomatik Güncellemeler\n\n"
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-            ),
-            "fields": [
-                {
-                    "name": "Directly",
-                    "value": f"**[Click to Install]({direct_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "MediaFire",
-                    "value": f"**[Click to Install]({mediafire_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Google Drive",
-                    "value": f"**[Click to Install]({gdrive_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Dropbox",
-                    "value": f"**[Click to Install]({dropbox_url})**",
-                    "inline": True
-                }
-            ],
-            "footer": {
-                "text": "Wildflover › Windows 10/11"
-            }
-        }
-        
-        payload = {
-            "username": "Wildflover",
-            "embeds": [embed]
-        }
-        
-        return self._send(payload)
+        return self._send(self._build_payload("text", None, direct_url, mediafire_url, gdrive_url, dropbox_url))
     
     def send_runeforge_style(self, banner_url: str, direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> bool:
         """
@@ -258,44 +174,34 @@ class DiscordWebhook:
             bool: Success status
         """
         
-        embed = {
-            "color": self.COLOR_PINK,
-            "title": "UPDATE 0.0.3",
-            "description": "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-            "fields": [
-                {
-                    "name": "Directly",
-                    "value": f"**[Click to Install]({direct_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "MediaFire",
-                    "value": f"**[Click to Install]({mediafire_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Google Drive",
-                    "value": f"**[Click to Install]({gdrive_url})**",
-                    "inline": True
-                },
-                {
-                    "name": "Dropbox",
-                    "value": f"**[Click to Install]({dropbox_url})**",
-                    "inline": True
-                }
-            ],
-            "image": {"url": banner_url},
-            "footer": {
-                "text": "Wildflover › Windows 10/11"
-            }
-        }
+        return self._send(self._build_payload("runeforge", banner_url, direct_url, mediafire_url, gdrive_url, dropbox_url))
+    
+    def send_all(self, banner_url: str, direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> bool:
+        """
+        Send every embed style concurrently - test run for comparing layouts
+        Requires aiohttp; total wall time is one round-trip instead of four
         
-        payload = {
-            "username": "Wildflover",
-            "embeds": [embed]
-        }
+        Args:
+            banner_url: Banner image URL
+            direct_url: Direct download link
+            mediafire_url: MediaFire page link
+            gdrive_url: Google Drive page link
+            dropbox_url: Dropbox page link
         
-        return self._send(payload)
+        Returns:
+            bool: True if every style was delivered
+        """
+        
+        if aiohttp is None:
+            self._log("WEBHOOK-ERROR", "aiohttp is required to send all styles", Fore.RED)
+            return False
+        
+        payloads = [
+            self._build_payload(style, None if style == "text" else banner_url,
+                                direct_url, mediafire_url, gdrive_url, dropbox_url)
+            for style in ("install", "text", "minimal", "runeforge")
+        ]
+        return all(asyncio.run(self._send_all_async(payloads)))
     
     def send_attachment_style(self, banner_path: str, direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> bool:
         """
@@ -330,6 +236,101 @@ class DiscordWebhook:
         
         return self._send_with_file(payload, banner_path)
     
+    @staticmethod
+    def _build_fields(direct_url: str, mediafire_url: str, gdrive_url: str, dropbox_url: str) -> List[dict]:
+        """Shared 2x2 grid of inline download link fields"""
+        return [
+            {"name": name, "value": f"**[Click to Install]({url})**", "inline": True}
+            for name, url in (
+                ("Directly", direct_url),
+                ("MediaFire", mediafire_url),
+                ("Google Drive", gdrive_url),
+                ("Dropbox", dropbox_url)
+            )
+        ]
+    
+    @staticmethod
+    def _base_embed(
+        title: str,
+        description: str,
+        fields: List[dict],
+        image_url: Optional[str] = None,
+        footer_text: str = "Wildflover › Windows 10/11",
+        color: int = COLOR_PINK
+    ) -> dict:
+        """Common embed layout - optional banner image below the field grid"""
+        embed = {
+            "color": color,
+            "title": title,
+            "description": description,
+            "fields": fields
+        }
+        if image_url is not None:
+            embed["image"] = {"url": image_url}
+        embed["footer"] = {"text": footer_text}
+        return embed
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_payload(
+        style: str,
+        banner_url: Optional[str],
+        direct_url: str,
+        mediafire_url: str,
+        gdrive_url: str,
+        dropbox_url: str
+    ) -> bytes:
+        """
+        Build and serialize an embed payload - cached per style and link set
+        so repeat sends skip dict construction and JSON encoding
+        
+        Args:
+            style: Embed layout - install, minimal, text or runeforge
+            banner_url: Banner image URL (None for text-only)
+            direct_url: Direct download link
+            mediafire_url: MediaFire page link
+            gdrive_url: Google Drive page link
+            dropbox_url: Dropbox page link
+        
+        Returns:
+            bytes: JSON body ready to post
+        """
+        
+        fields = DiscordWebhook._build_fields(direct_url, mediafire_url, gdrive_url, dropbox_url)
+        
+        # Single embed with inline fields - 2x2 grid layout
+        if style == "install":
+            embed = DiscordWebhook._base_embed("UPDATE 0.0.3", "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", fields, banner_url)
+        
+        elif style == "minimal":
+            embed = DiscordWebhook._base_embed("UPDATE 0.0.3", "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", fields, banner_url,
+                                               footer_text="Wildflover • Windows 10/11")
+        
+        elif style == "text":
+            description = (
+                "*League of Legends Skin Manager*\n"
+                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+                "`Wildflover` `Windows 10/11`\n\n"
+                "› **All Skins Unlocked** / Tüm Skinler Açık\n"
+                "› **Safe & Undetectable** / Güvenli & Tespit Edilemez\n"
+                "› **Auto Updates** / Otomatik Güncellemeler\n\n"
+                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+            )
+            embed = DiscordWebhook._base_embed("Wildflover", description, fields)
+        
+        elif style == "runeforge":
+            embed = DiscordWebhook._base_embed("UPDATE 0.0.3", "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", fields, banner_url)
+        
+        else:
+            raise ValueError(f"Unknown embed style: {style}")
+        
+        payload = {
+            "username": "Wildflover",
+            "embeds": [embed]
+        }
+        
+        return _dumps(payload)
+    
     def _send_with_file(self, payload: dict, file_path: str) -> bool:
         """Send webhook payload with file attachment"""
         try:
@@ -341,11 +342,23 @@ class DiscordWebhook:
                 }
                 
                 # Multipart form data - payload_json for embed data
-                response = requests.post(
-                    self.webhook_url,
-                    data={'payload_json': json.dumps(payload)},
-                    files=files
-                )
+                if MultipartEncoder is None:
+                    response = self.session.post(
+                        self.webhook_url,
+                        data={'payload_json': _dumps(payload)},
+                        files=files
+                    )
+                else:
+                    # Streamed body - the file is read in chunks while sending
+                    encoder = MultipartEncoder(fields={
+                        'payload_json': (None, _dumps(payload), 'application/json'),
+                        **files
+                    })
+                    response = self.session.post(
+                        self.webhook_url,
+                        data=encoder,
+                        headers={'Content-Type': encoder.content_type}
+                    )
             
             if response.status_code in [200, 204]:
                 self._log("WEBHOOK-SUCCESS", "Message with attachment delivered", Fore.GREEN)
@@ -359,14 +372,45 @@ class DiscordWebhook:
             self._log("WEBHOOK-EXCEPTION", str(e), Fore.RED)
             return False
     
-    def _send(self, payload: dict) -> bool:
-        """Send webhook payload to Discord"""
+    async def _send_all_async(self, payloads: List[bytes]) -> List[bool]:
+        """Send payloads in parallel over one keep-alive aiohttp session"""
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=85)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(self._send_async(session, payload) for payload in payloads))
+    
+    async def _send_async(self, session, payload: bytes) -> bool:
+        """Send pre-serialized webhook payload to Discord without blocking"""
         try:
             self._log("WEBHOOK-SEND", "Sending message to Discord...", Fore.YELLOW)
             
+            body, headers = _encode_body(payload)
+            async with session.post(
+                self.webhook_url,
+                data=body,
+                headers=headers
+            ) as response:
+                if response.status == 204:
+                    self._log("WEBHOOK-SUCCESS", "Message delivered successfully", Fore.GREEN)
+                    return True
+                else:
+                    self._log("WEBHOOK-ERROR", f"Status {response.status}", Fore.RED)
+                    self._log("WEBHOOK-RESPONSE", await response.text(), Fore.RED)
+                    return False
+                
+        except aiohttp.ClientError as e:
+            self._log("WEBHOOK-EXCEPTION", str(e), Fore.RED)
+            return False
+    
+    def _send(self, payload: bytes) -> bool:
+        """Send pre-serialized webhook payload to Discord"""
+        try:
+            self._log("WEBHOOK-SEND", "Sending message to Discord...", Fore.YELLOW)
+            
+            body, headers = _encode_body(payload)
             response = self.session.post(
                 self.webhook_url,
-                data=json.dumps(payload)
+                data=body,
+                headers=headers
             )
             
             if response.status_code == 204:
@@ -383,8 +427,8 @@ class DiscordWebhook:
 
 
 def print_banner() -> None:
-    """Display startup banner"""
-    print(f"""
+    """Display startup banner - written and flushed as one block"""
+    sys.stdout.write(f"""
 {Fore.MAGENTA}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 {Fore.WHITE}  WILDFLOVER DISCORD WEBHOOK TOOL
 {Fore.MAGENTA}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -392,7 +436,9 @@ def print_banner() -> None:
 {Fore.CYAN}  Module      {Fore.WHITE}: Discord Webhook Integration
 {Fore.CYAN}  Features    {Fore.WHITE}: Rich Embeds, Banner Support, Link Buttons
 {Fore.MAGENTA}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{Style.RESET_ALL}""")
+{Style.RESET_ALL}
+""")
+    sys.stdout.flush()
 
 
 def main():
@@ -401,23 +447,27 @@ def main():
     
     webhook = DiscordWebhook(WEBHOOK_URL)
     
-    print(f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Webhook configured")
-    print(f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Direct URL: {DIRECT_DOWNLOAD_URL[:50]}...")
-    print(f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} MediaFire URL: {MEDIAFIRE_URL[:50]}...")
-    print(f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Google Drive URL: {GOOGLE_DRIVE_URL[:50]}...")
-    print(f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Dropbox URL: {DROPBOX_URL[:50]}...")
-    print()
-    
-    # Message style selection
-    print(f"{Fore.MAGENTA}[SELECT]{Style.RESET_ALL} Choose message style:")
-    print(f"  {Fore.WHITE}1{Style.RESET_ALL} - Quad Buttons + Banner (Full)")
-    print(f"  {Fore.WHITE}2{Style.RESET_ALL} - Text Only with Links (No Image)")
-    print(f"  {Fore.WHITE}3{Style.RESET_ALL} - Minimal Quad Buttons")
-    print(f"  {Fore.WHITE}4{Style.RESET_ALL} - RuneForge Style")
-    print(f"  {Fore.WHITE}5{Style.RESET_ALL} - Attachment Style (Local File)")
-    print()
+    # Config summary and message style selection - joined into one write
+    menu = [
+        f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Webhook configured",
+        f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Direct URL: {DIRECT_DOWNLOAD_URL[:50]}...",
+        f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} MediaFire URL: {MEDIAFIRE_URL[:50]}...",
+        f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Google Drive URL: {GOOGLE_DRIVE_URL[:50]}...",
+        f"{Fore.CYAN}[CONFIG]{Style.RESET_ALL} Dropbox URL: {DROPBOX_URL[:50]}...",
+        "",
+        f"{Fore.MAGENTA}[SELECT]{Style.RESET_ALL} Choose message style:",
+        f"  {Fore.WHITE}1{Style.RESET_ALL} - Quad Buttons + Banner (Full)",
+        f"  {Fore.WHITE}2{Style.RESET_ALL} - Text Only with Links (No Image)",
+        f"  {Fore.WHITE}3{Style.RESET_ALL} - Minimal Quad Buttons",
+        f"  {Fore.WHITE}4{Style.RESET_ALL} - RuneForge Style",
+        f"  {Fore.WHITE}5{Style.RESET_ALL} - Attachment Style (Local File)",
+        f"  {Fore.WHITE}6{Style.RESET_ALL} - All Embed Styles (Test Run)",
+        "",
+    ]
+    sys.stdout.write("\n".join(menu) + "\n")
+    sys.stdout.flush()
     
-    choice = input(f"{Fore.CYAN}[INPUT]{Style.RESET_ALL} Enter choice (1-5): ").strip()
+    choice = input(f"{Fore.CYAN}[INPUT]{Style.RESET_ALL} Enter choice (1-6): ").strip()
     print()
     
     if choice == "1":
@@ -449,6 +499,13 @@ def main():
         # Attachment style - Full resolution banner as file upload
         webhook.send_attachment_style(BANNER_LOCAL_PATH, DIRECT_DOWNLOAD_URL, MEDIAFIRE_URL, GOOGLE_DRIVE_URL, DROPBOX_URL)
         
+    elif choice == "6":
+        # Test run - every embed style sent concurrently
+        if not BANNER_URL:
+            print(f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} BANNER_URL is empty!")
+            return
+        webhook.send_all(BANNER_URL, DIRECT_DOWNLOAD_URL, MEDIAFIRE_URL, GOOGLE_DRIVE_URL, DROPBOX_URL)
+        
     else:
         print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Invalid choice")
 
@@ -0,0 +1,18 @@
+"""
+File: fontcache.py
+Author: Wildflover
+Description: TrueType font cache shared by the banner generators
+             - Each (path, size) face is opened and parsed once per process
+Language: Python 3.x
+Dependencies: Pillow (PIL)
+"""
+
+from PIL import ImageFont
+import functools
+
+
+@functools.lru_cache(maxsize=64)
+def load_font(path, size):
+    """Load a TrueType font once per (path, size) - failed loads are not
+    cached, so callers' fallbacks still run"""
+    return ImageFont.truetype(path, size)
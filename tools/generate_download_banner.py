@@ -8,14 +8,27 @@ Description: Professional download channel banner for Discord
 Language: Python
 """
 
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
-import os
+from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter, features
+import numpy as np
+import hashlib
+from pathlib import Path
+from gradient import lerp_row, draw_gradient_text
+from fontcache import load_font
 
 # [CONFIG] Banner dimensions - Discord embed optimized (16:9 ratio)
 # Discord shows embeds at ~520px width, so we design for that scale
 BANNER_WIDTH = 1040
 BANNER_HEIGHT = 585
 
+# [CONFIG] Asset locations (resolved once at import)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = ROOT_DIR / 'public' / 'assets'
+DISCORD_DIR = ASSETS_DIR / 'discord'
+# Records the inputs of the last render so unchanged runs can be skipped
+STAMP_PATH = ROOT_DIR / '.cache' / 'download_banner.stamp'
+# Sources whose changes invalidate the stamp - this generator and its shared helpers
+CODE_PATHS = [Path(__file__), Path(__file__).with_name('gradient.py'), Path(__file__).with_name('fontcache.py')]
+
 # [COLORS] Pink/Purple theme
 GRADIENT_START = (201, 75, 124)   # Wildflover pink
 GRADIENT_END = (160, 90, 140)     # Purple-pink
@@ -24,6 +37,12 @@ LIGHT_ACCENT = (240, 150, 180)
 DARK_BG = (20, 15, 25)
 
 
+def _quantize(img, colors):
+    """Reduce to an 8-bit palette - libimagequant when Pillow is built with it"""
+    method = Image.Quantize.LIBIMAGEQUANT if features.check_feature('libimagequant') else Image.Quantize.MEDIANCUT
+    return img.quantize(colors=colors, method=method, dither=Image.Dither.FLOYDSTEINBERG)
+
+
 def draw_download_icon(draw, x, y, size, color):
     """Draw a modern download arrow icon"""
     # Arrow body - thicker lines for visibility
@@ -53,13 +72,24 @@ def generate_download_banner():
     print("[DOWNLOAD-BANNER] Creating Discord-optimized banner...")
     
     # Load background
-    source_path = os.path.join(os.path.dirname(__file__), '..', 
-                               'public', 'assets', 'backgrounds', 'wildflover_bg.jpg')
+    source_path = ASSETS_DIR / 'backgrounds' / 'wildflover_bg.jpg'
     
-    if not os.path.exists(source_path):
+    if not source_path.exists():
         print(f"[DOWNLOAD-BANNER] Error: Source not found at {source_path}")
         return False
     
+    # Skip the render when the source and the generator code are unchanged
+    output_path = DISCORD_DIR / 'download_banner.png'
+    embed_path = DISCORD_DIR / 'download_embed.png'
+    code_digest = hashlib.sha256(b''.join(path.read_bytes() for path in CODE_PATHS)).hexdigest()[:16]
+    stamp = f"{source_path.stat().st_mtime_ns}:{code_digest}"
+    try:
+        if output_path.exists() and embed_path.exists() and STAMP_PATH.read_text() == stamp:
+            print(f"[DOWNLOAD-BANNER] Up to date: {output_path}")
+            return True
+    except OSError:
+        pass
+    
     bg = Image.open(source_path).convert('RGBA')
     print(f"[DOWNLOAD-BANNER] Loaded source: {bg.size}")
     
@@ -82,27 +112,27 @@ def generate_download_banner():
     bg = ImageEnhance.Brightness(bg).enhance(0.5)
     bg = ImageEnhance.Contrast(bg).enhance(1.15)
     
-    # Dark gradient overlay - stronger on left side
-    overlay = Image.new('RGBA', (BANNER_WIDTH, BANNER_HEIGHT), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    
-    for x in range(BANNER_WIDTH):
-        ratio = x / BANNER_WIDTH
-        # Much darker on left for text area
-        alpha = int(200 - 120 * ratio)
-        overlay_draw.line([(x, 0), (x, BANNER_HEIGHT)], fill=(10, 5, 15, alpha))
-    
-    bg = Image.alpha_composite(bg, overlay)
+    # Dark gradient overlay - stronger on left side, much darker for the text area.
+    # The overlay color is constant, so compositing it over the opaque background
+    # reduces to a per-column lerp towards that color
+    overlay_alpha = (200 - 120 * (np.arange(BANNER_WIDTH) / BANNER_WIDTH)).astype(np.uint8)
+    weight = (overlay_alpha / 255.0).astype(np.float32)[None, :, None]
+    pixels = np.array(bg)
+    rgb = pixels[..., :3].astype(np.float32)
+    rgb *= 1 - weight
+    rgb += weight * np.array((10, 5, 15), dtype=np.float32)
+    pixels[..., :3] = np.rint(rgb)
+    bg = Image.fromarray(pixels, 'RGBA')
     
     # Load fonts - LARGE sizes for Discord embed visibility
     try:
         fonts = {
-            'title': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 72),
-            'subtitle': ImageFont.truetype("C:/Windows/Fonts/calibri.ttf", 36),
-            'badge': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 28),
-            'feature': ImageFont.truetype("C:/Windows/Fonts/calibri.ttf", 30),
-            'feature_tr': ImageFont.truetype("C:/Windows/Fonts/calibril.ttf", 24),
-            'brand': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 42)
+            'title': load_font("C:/Windows/Fonts/calibrib.ttf", 72),
+            'subtitle': load_font("C:/Windows/Fonts/calibri.ttf", 36),
+            'badge': load_font("C:/Windows/Fonts/calibrib.ttf", 28),
+            'feature': load_font("C:/Windows/Fonts/calibri.ttf", 30),
+            'feature_tr': load_font("C:/Windows/Fonts/calibril.ttf", 24),
+            'brand': load_font("C:/Windows/Fonts/calibrib.ttf", 42)
         }
     except Exception as e:
         print(f"[DOWNLOAD-BANNER] Font error: {e}, using default")
@@ -123,15 +153,18 @@ def generate_download_banner():
     circle_x = icon_x + icon_size // 2
     circle_y = icon_y + icon_size // 2
     
-    # Gradient glow circle
-    for r in range(circle_r, 0, -1):
-        ratio = r / circle_r
-        alpha = int(200 * ratio)
-        cr = int(GRADIENT_START[0] * ratio + 30 * (1 - ratio))
-        cg = int(GRADIENT_START[1] * ratio + 15 * (1 - ratio))
-        cb = int(GRADIENT_START[2] * ratio + 40 * (1 - ratio))
-        draw.ellipse([circle_x - r, circle_y - r, circle_x + r, circle_y + r],
-                     fill=(cr, cg, cb, alpha))
+    # Gradient glow circle - each pixel takes the color of its ring, computed
+    # once from a distance field instead of stacking circle_r filled discs
+    yy, xx = np.ogrid[-circle_r:circle_r + 1, -circle_r:circle_r + 1]
+    ring = np.maximum(np.rint(np.hypot(xx, yy)), 1)
+    ratio = (ring / circle_r)[..., None]
+    glow = np.empty((2 * circle_r + 1, 2 * circle_r + 1, 4), dtype=np.uint8)
+    glow[..., :3] = (np.array(GRADIENT_START) * ratio + np.array((30, 15, 40)) * (1 - ratio)).clip(0, 255).astype(np.uint8)
+    glow[..., 3] = (200 * ratio[..., 0]).clip(0, 255).astype(np.uint8)
+    # Footprint is the outermost disc, rasterized the same way as before
+    glow_mask = Image.new('L', (2 * circle_r + 1, 2 * circle_r + 1), 0)
+    ImageDraw.Draw(glow_mask).ellipse([0, 0, 2 * circle_r, 2 * circle_r], fill=255)
+    bg.paste(Image.fromarray(glow, 'RGBA'), (circle_x - circle_r, circle_y - circle_r), glow_mask)
     
     draw_download_icon(draw, icon_x + 10, icon_y + 8, 55, (255, 255, 255, 255))
     
@@ -158,14 +191,11 @@ def generate_download_banner():
     badge_w = badge_bbox[2] - badge_bbox[0] + 30
     badge_h = 40
     
-    # Draw gradient badge
-    for i in range(badge_h):
-        ratio = i / badge_h
-        r = int(GRADIENT_START[0] + (GRADIENT_END[0] - GRADIENT_START[0]) * ratio)
-        g = int(GRADIENT_START[1] + (GRADIENT_END[1] - GRADIENT_START[1]) * ratio)
-        b = int(GRADIENT_START[2] + (GRADIENT_END[2] - GRADIENT_START[2]) * ratio)
-        draw.line([(content_x, badge_y + i), (content_x + badge_w, badge_y + i)],
-                  fill=(r, g, b, 230))
+    # Draw gradient badge - one color per row, broadcast across the width
+    badge = np.empty((badge_h, badge_w + 1, 4), dtype=np.uint8)
+    badge[..., :3] = lerp_row(GRADIENT_START, GRADIENT_END, np.arange(badge_h) / badge_h)[:, None, :]
+    badge[..., 3] = 230
+    bg.paste(Image.fromarray(badge, 'RGBA'), (content_x, badge_y))
     
     # Badge text centered
     draw.text((content_x + 15, badge_y + 6), badge_text, font=fonts['badge'], 
@@ -177,7 +207,7 @@ def generate_download_banner():
               fill=(180, 175, 195, 255))
     
     # Features - simplified, larger text
-    features = [
+    feature_lines = [
         ("All Skins Unlocked", "Tüm Skinler Açık"),
         ("Safe & Undetectable", "Güvenli"),
         ("Auto Updates", "Otomatik Güncelleme")
@@ -186,7 +216,10 @@ def generate_download_banner():
     feature_y = 280
     feature_spacing = 55
     
-    for feat_en, feat_tr in features:
+    # English widths measured up front - advance widths, no glyph bboxes
+    en_widths = [draw.textlength(feat_en, font=fonts['feature']) for feat_en, _ in feature_lines]
+    
+    for (feat_en, feat_tr), en_w in zip(feature_lines, en_widths):
         # Pink bullet
         bullet_color = GRADIENT_START + (255,)
         draw.text((content_x, feature_y - 2), "›", font=fonts['feature'], fill=bullet_color)
@@ -196,8 +229,6 @@ def generate_download_banner():
                   fill=(240, 235, 250, 255))
         
         # Turkish - smaller, muted
-        en_bbox = draw.textbbox((0, 0), feat_en, font=fonts['feature'])
-        en_w = en_bbox[2] - en_bbox[0]
         draw.text((content_x + 30 + en_w, feature_y + 4), f" / {feat_tr}",
                   font=fonts['feature_tr'], fill=(160, 150, 175, 200))
         
@@ -213,16 +244,8 @@ def generate_download_banner():
     # "flover" in gradient pink
     wild_bbox = draw.textbbox((0, 0), "Wild", font=fonts['brand'])
     flover_x = brand_x + (wild_bbox[2] - wild_bbox[0])
-    
-    for i, char in enumerate("flover"):
-        ratio = i / 5
-        r = int(GRADIENT_START[0] + (LIGHT_ACCENT[0] - GRADIENT_START[0]) * ratio)
-        g = int(GRADIENT_START[1] + (LIGHT_ACCENT[1] - GRADIENT_START[1]) * ratio)
-        b = int(GRADIENT_START[2] + (LIGHT_ACCENT[2] - GRADIENT_START[2]) * ratio)
-        
-        char_bbox = draw.textbbox((0, 0), "flover"[:i], font=fonts['brand'])
-        char_x = flover_x + (char_bbox[2] - char_bbox[0])
-        draw.text((char_x, brand_y), char, font=fonts['brand'], fill=(r, g, b, 240))
+    draw_gradient_text(bg, (flover_x, brand_y), "flover", fonts['brand'],
+                       GRADIENT_START, LIGHT_ACCENT, alpha=240)
     
     # Tagline
     tagline = "LoL Skin Manager"
@@ -231,16 +254,16 @@ def generate_download_banner():
     
     # === DECORATIVE ELEMENTS ===
     
-    # Bottom accent line - gradient
+    # Bottom accent line - gradient, one column ramp tiled over 4 rows
     line_y = BANNER_HEIGHT - 6
-    for x in range(BANNER_WIDTH):
-        ratio = x / BANNER_WIDTH
-        alpha = int(180 * (1 - abs(ratio - 0.25) * 1.8))
-        if alpha > 0:
-            r = int(GRADIENT_START[0] + (GRADIENT_END[0] - GRADIENT_START[0]) * ratio)
-            g = int(GRADIENT_START[1] + (GRADIENT_END[1] - GRADIENT_START[1]) * ratio)
-            b = int(GRADIENT_START[2] + (GRADIENT_END[2] - GRADIENT_START[2]) * ratio)
-            draw.line([(x, line_y), (x, line_y + 3)], fill=(r, g, b, max(0, alpha)))
+    ratio = np.arange(BANNER_WIDTH) / BANNER_WIDTH
+    alpha = np.trunc(180 * (1 - np.abs(ratio - 0.25) * 1.8))
+    accent = np.empty((4, BANNER_WIDTH, 4), dtype=np.uint8)
+    accent[..., :3] = lerp_row(GRADIENT_START, GRADIENT_END, ratio)
+    accent[..., 3] = np.clip(alpha, 0, 255).astype(np.uint8)
+    # Columns that fade out entirely are left untouched
+    accent_mask = np.broadcast_to(np.where(alpha > 0, 255, 0).astype(np.uint8), (4, BANNER_WIDTH))
+    bg.paste(Image.fromarray(accent, 'RGBA'), (0, line_y), Image.fromarray(np.ascontiguousarray(accent_mask), 'L'))
     
     # Corner accents
     corner_size = 35
@@ -248,38 +271,47 @@ def generate_download_banner():
     corner_width = 3
     margin = 20
     
-    # Top-left
-    draw.line([(margin, margin), (margin, margin + corner_size)], fill=corner_color, width=corner_width)
-    draw.line([(margin, margin), (margin + corner_size, margin)], fill=corner_color, width=corner_width)
-    
-    # Top-right
-    draw.line([(BANNER_WIDTH - margin, margin), (BANNER_WIDTH - margin, margin + corner_size)], fill=corner_color, width=corner_width)
-    draw.line([(BANNER_WIDTH - margin, margin), (BANNER_WIDTH - margin - corner_size, margin)], fill=corner_color, width=corner_width)
-    
-    # Bottom-left
-    draw.line([(margin, BANNER_HEIGHT - margin), (margin, BANNER_HEIGHT - margin - corner_size)], fill=corner_color, width=corner_width)
-    draw.line([(margin, BANNER_HEIGHT - margin), (margin + corner_size, BANNER_HEIGHT - margin)], fill=corner_color, width=corner_width)
-    
-    # Bottom-right
-    draw.line([(BANNER_WIDTH - margin, BANNER_HEIGHT - margin), (BANNER_WIDTH - margin, BANNER_HEIGHT - margin - corner_size)], fill=corner_color, width=corner_width)
-    draw.line([(BANNER_WIDTH - margin, BANNER_HEIGHT - margin), (BANNER_WIDTH - margin - corner_size, BANNER_HEIGHT - margin)], fill=corner_color, width=corner_width)
+    # L-shaped stroke rasterized once for the top-left corner, flipped for the others
+    half = corner_width // 2
+    tile_size = corner_size + half + 1
+    corner_mask = np.zeros((tile_size, tile_size), dtype=np.uint8)
+    corner_mask[half:, :corner_width] = 255
+    corner_mask[:corner_width, half:] = 255
+    corner_mask = Image.fromarray(corner_mask, 'L')
+    
+    near = margin - half
+    far_x = BANNER_WIDTH - margin - corner_size
+    far_y = BANNER_HEIGHT - margin - corner_size
+    corners = [
+        ((near, near), None),                                   # Top-left
+        ((far_x, near), Image.Transpose.FLIP_LEFT_RIGHT),       # Top-right
+        ((near, far_y), Image.Transpose.FLIP_TOP_BOTTOM),       # Bottom-left
+        ((far_x, far_y), Image.Transpose.ROTATE_180),           # Bottom-right
+    ]
+    for (x, y), transpose in corners:
+        mask = corner_mask if transpose is None else corner_mask.transpose(transpose)
+        bg.paste(corner_color, (x, y, x + tile_size, y + tile_size), mask)
     
     # === SAVE OUTPUTS ===
-    output_dir = os.path.join(os.path.dirname(__file__), '..', 'public', 'assets', 'discord')
-    os.makedirs(output_dir, exist_ok=True)
+    # 8-bit palette PNGs - a third of the bytes to DEFLATE and serve
+    DISCORD_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Main banner - full size
-    output_path = os.path.join(output_dir, 'download_banner.png')
-    bg.convert('RGB').save(output_path, 'PNG', quality=95)
+    # Main banner - full size; the RGB copy is shared with the embed variant
+    banner_rgb = bg.convert('RGB')
+    _quantize(banner_rgb, 256).save(output_path, 'PNG', compress_level=6)
     print(f"[DOWNLOAD-BANNER] Saved main: {output_path} ({BANNER_WIDTH}x{BANNER_HEIGHT})")
     
     # Discord embed optimized - 520px width (Discord's typical embed width)
-    embed_path = os.path.join(output_dir, 'download_embed.png')
     embed_width = 520
     embed_height = int(BANNER_HEIGHT * (embed_width / BANNER_WIDTH))
-    bg.resize((embed_width, embed_height), Image.Resampling.LANCZOS).convert('RGB').save(embed_path, 'PNG', quality=95)
+    # Single 2x downscale of the finished RGB banner - BILINEAR is enough at this ratio
+    embed = banner_rgb.resize((embed_width, embed_height), Image.Resampling.BILINEAR)
+    _quantize(embed, 128).save(embed_path, 'PNG', compress_level=6)
     print(f"[DOWNLOAD-BANNER] Saved embed: {embed_path} ({embed_width}x{embed_height})")
     
+    STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    STAMP_PATH.write_text(stamp)
+    
     return True
 
 
@@ -9,7 +9,11 @@ Language: Python
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
+import numpy as np
+import functools
 import os
+from gradient import lerp_row, draw_gradient_text
+from fontcache import load_font
 
 # [CONFIG] Output dimensions
 OUTPUT_WIDTH = 1400
@@ -21,47 +25,43 @@ GRADIENT_SECONDARY = (220, 140, 180)  # Light pink
 ACCENT = (200, 120, 170)
 DARK_BG = (25, 15, 35)
 
-def create_step_box(draw, x, y, width, height, step_num, title_en, title_tr, desc_en, desc_tr, fonts, colors):
-    """Draw a step instruction box"""
-    # Semi-transparent background
-    box_color = (30, 20, 45, 200)
-    
-    # Box with rounded feel (rectangle for simplicity)
-    for i in range(height):
-        alpha = 180 + int(20 * (1 - i/height))
-        draw.line([(x, y + i), (x + width, y + i)], fill=(25, 18, 38, alpha))
+# [CONFIG] Step number circle - centre offset inside the box and radius
+STEP_CIRCLE_X = 30
+STEP_CIRCLE_Y = 25
+STEP_CIRCLE_R = 18
+
+@functools.lru_cache(maxsize=None)
+def create_step_template(width, height):
+    """Render the parts every step box shares - background, accent bar and
+    number circle - once; each step pastes it and draws only its own text"""
+    # Semi-transparent background, alpha fading slightly towards the bottom
+    # (rows ran from x to x + width inclusive)
+    box = np.empty((height, width + 1, 4), dtype=np.uint8)
+    box[..., :3] = (25, 18, 38)
+    box[..., 3] = (180 + (20 * (1 - np.arange(height) / height)).astype(np.uint8))[:, None]
     
     # Left accent bar
     bar_width = 4
-    for i in range(height - 20):
-        ratio = i / height
-        r = int(GRADIENT_PRIMARY[0] + (GRADIENT_SECONDARY[0] - GRADIENT_PRIMARY[0]) * ratio)
-        g = int(GRADIENT_PRIMARY[1] + (GRADIENT_SECONDARY[1] - GRADIENT_PRIMARY[1]) * ratio)
-        b = int(GRADIENT_PRIMARY[2] + (GRADIENT_SECONDARY[2] - GRADIENT_PRIMARY[2]) * ratio)
-        draw.line([(x, y + 10 + i), (x + bar_width, y + 10 + i)], fill=(r, g, b, 255))
+    box[10:height - 10, :bar_width + 1, :3] = lerp_row(GRADIENT_PRIMARY, GRADIENT_SECONDARY,
+                                                       np.arange(height - 20) / height)[:, None, :]
+    box[10:height - 10, :bar_width + 1, 3] = 255
     
-    # Step number circle
-    circle_x = x + 30
-    circle_y = y + 25
-    circle_r = 18
-    
-    # Draw circle
-    for angle_offset in range(360):
-        import math
-        rad = math.radians(angle_offset)
-        for r_off in range(circle_r):
-            px = int(circle_x + r_off * math.cos(rad))
-            py = int(circle_y + r_off * math.sin(rad))
-            if r_off < circle_r - 2:
-                ratio = angle_offset / 360
-                cr = int(GRADIENT_PRIMARY[0] + (GRADIENT_SECONDARY[0] - GRADIENT_PRIMARY[0]) * ratio)
-                cg = int(GRADIENT_PRIMARY[1] + (GRADIENT_SECONDARY[1] - GRADIENT_PRIMARY[1]) * ratio)
-                cb = int(GRADIENT_PRIMARY[2] + (GRADIENT_SECONDARY[2] - GRADIENT_PRIMARY[2]) * ratio)
+    template = Image.fromarray(box, 'RGBA')
     
     # Simple filled circle
-    draw.ellipse([circle_x - circle_r, circle_y - circle_r, 
-                  circle_x + circle_r, circle_y + circle_r], 
-                 fill=GRADIENT_PRIMARY + (255,))
+    ImageDraw.Draw(template).ellipse([STEP_CIRCLE_X - STEP_CIRCLE_R, STEP_CIRCLE_Y - STEP_CIRCLE_R,
+                                      STEP_CIRCLE_X + STEP_CIRCLE_R, STEP_CIRCLE_Y + STEP_CIRCLE_R],
+                                     fill=GRADIENT_PRIMARY + (255,))
+    return template
+
+def create_step_box(bg, draw, x, y, width, height, step_num, title_en, title_tr, desc_en, desc_tr, fonts, colors):
+    """Draw a step instruction box"""
+    # Shared box, bar and circle - replaces the pixels below it like the draw calls did
+    bg.paste(create_step_template(width, height), (x, y))
+    
+    # Step number circle
+    circle_x = x + STEP_CIRCLE_X
+    circle_y = y + STEP_CIRCLE_Y
     
     # Step number
     num_text = str(step_num)
@@ -120,34 +120,30 @@ def generate_login_guide():
         top = (bg.height - new_height) // 2
         bg = bg.crop((0, top, bg.width, top + new_height))
     
-    bg = bg.resize((OUTPUT_WIDTH, OUTPUT_HEIGHT), Image.Resampling.LANCZOS)
+    bg = bg.resize((OUTPUT_WIDTH, OUTPUT_HEIGHT), Image.Resampling.LANCZOS, reducing_gap=3.0)
     
     # Darken for readability
     bg = ImageEnhance.Brightness(bg).enhance(0.7)
     
     # Add gradient overlay (darker on right side for text)
-    overlay = Image.new('RGBA', (OUTPUT_WIDTH, OUTPUT_HEIGHT), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    
-    for x in range(OUTPUT_WIDTH):
-        # Stronger on right side
-        ratio = x / OUTPUT_WIDTH
-        alpha = int(50 + 120 * ratio)
-        overlay_draw.line([(x, 0), (x, OUTPUT_HEIGHT)], fill=(20, 12, 30, alpha))
+    overlay = np.empty((OUTPUT_HEIGHT, OUTPUT_WIDTH, 4), dtype=np.uint8)
+    overlay[..., :3] = (20, 12, 30)
+    # Stronger on right side - one alpha per column, broadcast over rows
+    overlay[..., 3] = (50 + 120 * (np.arange(OUTPUT_WIDTH) / OUTPUT_WIDTH)).astype(np.uint8)
     
-    bg = Image.alpha_composite(bg, overlay)
+    bg.alpha_composite(Image.fromarray(overlay, 'RGBA'))
     
     # Load fonts
     try:
         fonts = {
-            'header': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 42),
-            'header_small': ImageFont.truetype("C:/Windows/Fonts/calibri.ttf", 28),
-            'number': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 22),
-            'title': ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 18),
-            'title_small': ImageFont.truetype("C:/Windows/Fonts/calibrii.ttf", 14),
-            'desc': ImageFont.truetype("C:/Windows/Fonts/calibri.ttf", 15),
-            'desc_small': ImageFont.truetype("C:/Windows/Fonts/calibrii.ttf", 13),
-            'footer': ImageFont.truetype("C:/Windows/Fonts/calibril.ttf", 14)
+            'header': load_font("C:/Windows/Fonts/calibrib.ttf", 42),
+            'header_small': load_font("C:/Windows/Fonts/calibri.ttf", 28),
+            'number': load_font("C:/Windows/Fonts/calibrib.ttf", 22),
+            'title': load_font("C:/Windows/Fonts/calibrib.ttf", 18),
+            'title_small': load_font("C:/Windows/Fonts/calibrii.ttf", 14),
+            'desc': load_font("C:/Windows/Fonts/calibri.ttf", 15),
+            'desc_small': load_font("C:/Windows/Fonts/calibrii.ttf", 13),
+            'footer': load_font("C:/Windows/Fonts/calibril.ttf", 14)
         }
     except:
         default = ImageFont.load_default()
@@ -165,30 +161,21 @@ def generate_login_guide():
     header_y = 60
     
     # Draw header with gradient effect
-    for i, char in enumerate(header_en):
-        ratio = i / max(len(header_en) - 1, 1)
-        r = int(GRADIENT_PRIMARY[0] + (GRADIENT_SECONDARY[0] - GRADIENT_PRIMARY[0]) * ratio)
-        g = int(GRADIENT_PRIMARY[1] + (GRADIENT_SECONDARY[1] - GRADIENT_PRIMARY[1]) * ratio)
-        b = int(GRADIENT_PRIMARY[2] + (GRADIENT_SECONDARY[2] - GRADIENT_PRIMARY[2]) * ratio)
-        
-        char_bbox = draw.textbbox((0, 0), header_en[:i], font=fonts['header'])
-        char_x = header_x + (char_bbox[2] - char_bbox[0])
-        draw.text((char_x, header_y), char, font=fonts['header'], fill=(r, g, b, 255))
+    draw_gradient_text(bg, (header_x, header_y), header_en, fonts['header'],
+                       GRADIENT_PRIMARY, GRADIENT_SECONDARY)
     
     # Turkish header
     draw.text((header_x, header_y + 48), header_tr, font=fonts['header_small'], 
               fill=(160, 140, 170, 200))
     
-    # Divider line
+    # Divider line - gradient row built in one pass, pasted over the pixels it replaces
     div_y = header_y + 90
     div_width = 350
-    for i in range(div_width):
-        ratio = i / div_width
-        alpha = int(200 * (1 - abs(ratio - 0.5) * 2) * 0.7)
-        r = int(GRADIENT_PRIMARY[0] + (GRADIENT_SECONDARY[0] - GRADIENT_PRIMARY[0]) * ratio)
-        g = int(GRADIENT_PRIMARY[1] + (GRADIENT_SECONDARY[1] - GRADIENT_PRIMARY[1]) * ratio)
-        b = int(GRADIENT_PRIMARY[2] + (GRADIENT_SECONDARY[2] - GRADIENT_PRIMARY[2]) * ratio)
-        draw.point((header_x + i, div_y), fill=(r, g, b, alpha))
+    ratio = np.arange(div_width) / div_width
+    divider = np.empty((1, div_width, 4), dtype=np.uint8)
+    divider[0, :, :3] = lerp_row(GRADIENT_PRIMARY, GRADIENT_SECONDARY, ratio)
+    divider[0, :, 3] = (200 * (1 - np.abs(ratio - 0.5) * 2) * 0.7).astype(np.uint8)
+    bg.paste(Image.fromarray(divider, 'RGBA'), (header_x, div_y))
     
     # Steps data
     steps = [
@@ -231,7 +218,7 @@ def generate_login_guide():
     step_width = 420
     
     for i, step in enumerate(steps):
-        create_step_box(draw, step_x, step_y + i * (step_height + 15), 
+        create_step_box(bg, draw, step_x, step_y + i * (step_height + 15), 
                        step_width, step_height, i + 1,
                        step['title_en'], step['title_tr'],
                        step['desc_en'], step['desc_tr'],
@@ -258,27 +245,22 @@ def generate_login_guide():
     # "flover" in gradient
     wild_bbox = draw.textbbox((0, 0), "Wild", font=fonts['header_small'])
     flover_x = brand_x + (wild_bbox[2] - wild_bbox[0])
-    
-    for i, char in enumerate("flover"):
-        ratio = i / 5
-        r = int(GRADIENT_PRIMARY[0] + (GRADIENT_SECONDARY[0] - GRADIENT_PRIMARY[0]) * ratio)
-        g = int(GRADIENT_PRIMARY[1] + (GRADIENT_SECONDARY[1] - GRADIENT_PRIMARY[1]) * ratio)
-        b = int(GRADIENT_PRIMARY[2] + (GRADIENT_SECONDARY[2] - GRADIENT_PRIMARY[2]) * ratio)
-        
-        char_bbox = draw.textbbox((0, 0), "flover"[:i], font=fonts['header_small'])
-        char_x = flover_x + (char_bbox[2] - char_bbox[0])
-        draw.text((char_x, brand_y), char, font=fonts['header_small'], fill=(r, g, b, 200))
+    draw_gradient_text(bg, (flover_x, brand_y), "flover", fonts['header_small'],
+                       GRADIENT_PRIMARY, GRADIENT_SECONDARY, alpha=200)
     
     # Save output
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'public', 'assets', 'discord')
     os.makedirs(output_dir, exist_ok=True)
     
+    # Alpha dropped once - both versions resample and encode from the same RGB pixels
+    guide_rgb = bg.convert('RGB')
+    
     output_path = os.path.join(output_dir, 'login_guide.png')
-    bg.convert('RGB').save(output_path, 'PNG', quality=95)
+    guide_rgb.save(output_path, 'PNG', compress_level=6)
     
     # Smaller version
     small_path = os.path.join(output_dir, 'login_guide_small.png')
-    bg.resize((1000, 643), Image.Resampling.LANCZOS).convert('RGB').save(small_path, 'PNG', quality=90)
+    guide_rgb.resize((1000, 643), Image.Resampling.LANCZOS, reducing_gap=3.0).save(small_path, 'PNG', compress_level=6)
     
     print(f"[LOGIN-GUIDE] Saved: {output_path}")
     print(f"[LOGIN-GUIDE] Saved: {small_path}")
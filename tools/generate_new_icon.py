@@ -8,8 +8,12 @@ Language: Python 3.x
 Dependencies: Pillow (PIL)
 """
 
+import functools
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw
+from iconpipeline import build_pyramid
 
 # [CONFIG] Input and output paths
 INPUT_FILE = "tools/new_icon.jpg"
@@ -27,6 +31,9 @@ BORDER_RADIUS = 0.15  # 15% of icon size for rounded corners
 BORDER_COLOR = (201, 75, 124)  # #c94b7c - Wildflover pink accent
 BORDER_WIDTH_RATIO = 0.04  # 4% of icon size
 
+# [CONFIG] PNG zlib level - level 9 / optimize costs several times the CPU for a few % on icons
+PNG_COMPRESS_LEVEL = 6
+
 
 def create_directories():
     """Create output directories if they don't exist"""
@@ -35,8 +42,10 @@ def create_directories():
     print(f"[DIR-CREATE] Output directories ready")
 
 
+@functools.lru_cache(maxsize=32)
 def create_rounded_mask(size, radius):
-    """Create a rounded rectangle mask for the icon"""
+    """Create a rounded rectangle mask for the icon - cached per (size, radius),
+    callers must treat the returned mask as read-only"""
     mask = Image.new('L', (size, size), 0)
     draw = ImageDraw.Draw(mask)
     
@@ -72,7 +81,7 @@ def add_border_frame(image, size):
     
     # Resize source image to fit inside border
     inner_size = size - (border_width * 2)
-    inner_image = image.resize((inner_size, inner_size), Image.Resampling.LANCZOS)
+    inner_image = image.resize((inner_size, inner_size), Image.Resampling.LANCZOS, reducing_gap=3.0)
     
     # Create rounded mask for inner image
     inner_mask = create_rounded_mask(inner_size, max(1, radius - border_width))
@@ -91,65 +100,68 @@ def add_border_frame(image, size):
     return output
 
 
-def generate_png_icons(source_image):
-    """Generate PNG icons in multiple sizes with border frame"""
+def encode_png(icon):
+    """Encode icon to PNG bytes - zlib releases the GIL, so threads encode in parallel"""
+    buffer = io.BytesIO()
+    icon.save(buffer, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+def generate_png_icons(icons):
+    """Generate PNG icons in multiple sizes with border frame - returns the
+    encoded {size: bytes} so later outputs reuse them"""
     print(f"\n[PNG-GEN] Starting PNG generation with border frame")
     
-    generated = []
-    for size in SIZES:
-        # Create icon with border frame
-        icon = add_border_frame(source_image, size)
-        
+    # Every size encoded once, in parallel
+    with ThreadPoolExecutor() as executor:
+        encoded = dict(zip(SIZES, executor.map(encode_png, [icons[size] for size in SIZES])))
+    
+    for size, data in encoded.items():
         # Save to public assets
         output_path = os.path.join(OUTPUT_DIR, f"wildflower_{size}x{size}.png")
-        icon.save(output_path, "PNG", optimize=True)
-        generated.append(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(data)
         print(f"[PNG-GEN] {size}x{size} -> {output_path}")
         
-        # Copy to Tauri icons directory
+        # Copy to Tauri icons directory - same bytes, no second encode
         tauri_path = os.path.join(TAURI_ICONS_DIR, f"{size}x{size}.png")
-        icon.save(tauri_path, "PNG", optimize=True)
+        with open(tauri_path, 'wb') as f:
+            f.write(data)
         print(f"[TAURI-COPY] {size}x{size} -> {tauri_path}")
     
-    return generated
+    return encoded
 
 
-def generate_ico_file(source_image):
+def generate_ico_file(icons):
     """Generate Windows ICO file with multiple sizes - proper ICO format"""
     print(f"\n[ICO-GEN] Starting ICO generation (proper format)")
     
     # ICO needs specific sizes including 256x256 for high-DPI
     ico_sizes_list = [16, 24, 32, 48, 64, 128, 256]
     
-    # Create list of icons for ICO - must be RGBA for transparency
-    ico_images = []
-    for size in ico_sizes_list:
-        icon = add_border_frame(source_image, size)
-        # Ensure RGBA mode for ICO with transparency
-        if icon.mode != 'RGBA':
-            icon = icon.convert('RGBA')
-        ico_images.append(icon)
-    
-    # Save as ICO to public assets - use largest as base
-    ico_path_public = os.path.join(OUTPUT_DIR, "wildflower.ico")
+    # Pyramid levels are already RGBA for transparency
+    ico_images = [icons[size] for size in ico_sizes_list]
     
-    # ICO format: save with all sizes embedded
+    # ICO format: all sizes embedded, largest as base - encoded once for both copies
+    buffer = io.BytesIO()
     ico_images[-1].save(
-        ico_path_public,
+        buffer,
         format="ICO",
         sizes=[(s, s) for s in ico_sizes_list],
         append_images=ico_images[:-1]
     )
+    data = buffer.getvalue()
+    
+    # Save as ICO to public assets
+    ico_path_public = os.path.join(OUTPUT_DIR, "wildflower.ico")
+    with open(ico_path_public, 'wb') as f:
+        f.write(data)
     print(f"[ICO-GEN] Multi-size ICO -> {ico_path_public} ({len(ico_sizes_list)} sizes)")
     
     # Copy to Tauri icons directory
     ico_path_tauri = os.path.join(TAURI_ICONS_DIR, "icon.ico")
-    ico_images[-1].save(
-        ico_path_tauri,
-        format="ICO",
-        sizes=[(s, s) for s in ico_sizes_list],
-        append_images=ico_images[:-1]
-    )
+    with open(ico_path_tauri, 'wb') as f:
+        f.write(data)
     print(f"[ICO-GEN] Tauri ICO -> {ico_path_tauri}")
     
     # Verify ICO file size
@@ -159,21 +171,23 @@ def generate_ico_file(source_image):
     return ico_path_public, ico_path_tauri
 
 
-def generate_main_icon(source_image):
+def generate_main_icon(encoded):
     """Generate main icon.png for Tauri (512x512)"""
     print(f"\n[MAIN-ICON] Generating main icon.png")
     
-    # Create 512x512 icon with border
-    main_icon = add_border_frame(source_image, 512)
+    # 512x512 master with border - the bytes generate_png_icons already encoded
+    data = encoded[512]
     
     # Save to Tauri icons
     main_path = os.path.join(TAURI_ICONS_DIR, "icon.png")
-    main_icon.save(main_path, "PNG", optimize=True)
+    with open(main_path, 'wb') as f:
+        f.write(data)
     print(f"[MAIN-ICON] 512x512 -> {main_path}")
     
     # Also save to public assets
     public_path = os.path.join(OUTPUT_DIR, "icon.png")
-    main_icon.save(public_path, "PNG", optimize=True)
+    with open(public_path, 'wb') as f:
+        f.write(data)
     print(f"[MAIN-ICON] Public copy -> {public_path}")
     
     return main_path
@@ -206,14 +220,17 @@ def main():
             # Create directories
             create_directories()
             
+            # Border frame rendered once at 512, every smaller size downscaled from it
+            icons = build_pyramid(add_border_frame(img, 512), SIZES)
+            
             # Generate all icons
-            png_files = generate_png_icons(img)
-            ico_files = generate_ico_file(img)
-            main_icon = generate_main_icon(img)
+            encoded = generate_png_icons(icons)
+            ico_files = generate_ico_file(icons)
+            main_icon = generate_main_icon(encoded)
             
             print("\n" + "-" * 60)
             print("[COMPLETE] Icon generation finished successfully")
-            print(f"[STATS] PNG files: {len(png_files)}")
+            print(f"[STATS] PNG files: {len(encoded)}")
             print(f"[STATS] ICO files: 2 (public + tauri)")
             print(f"[STATS] Main icon: {main_icon}")
             print(f"[OUTPUT] {OUTPUT_DIR}")
@@ -6,7 +6,10 @@ Language: Python
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+import numpy as np
 import os
+from gradient import lerp_row, draw_gradient_text
+from fontcache import load_font
 
 # [CONFIG] Banner dimensions
 BANNER_WIDTH = 1200
@@ -63,39 +66,37 @@ def generate_welcome_banner():
         top = (bg.height - new_height) // 2
         bg = bg.crop((0, top, bg.width, top + new_height))
     
-    bg = bg.resize((BANNER_WIDTH, BANNER_HEIGHT), Image.Resampling.LANCZOS)
+    bg = bg.resize((BANNER_WIDTH, BANNER_HEIGHT), Image.Resampling.LANCZOS, reducing_gap=3.0)
     bg = ImageEnhance.Brightness(bg).enhance(0.82)
     
     # Dark overlay for readability
-    overlay = Image.new('RGBA', (BANNER_WIDTH, BANNER_HEIGHT), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
+    overlay = np.empty((BANNER_HEIGHT, BANNER_WIDTH, 4), dtype=np.uint8)
+    overlay[..., :3] = (10, 15, 20)
+    # Strongest at the vertical centre - one alpha per row, broadcast over columns
+    dist = np.abs(np.arange(BANNER_HEIGHT) - BANNER_HEIGHT/2) / (BANNER_HEIGHT/2)
+    overlay[..., 3] = (85 * (1 - dist * 0.5)).astype(np.uint8)[:, None]
     
-    for y in range(BANNER_HEIGHT):
-        dist = abs(y - BANNER_HEIGHT/2) / (BANNER_HEIGHT/2)
-        alpha = int(85 * (1 - dist * 0.5))
-        overlay_draw.line([(0, y), (BANNER_WIDTH, y)], fill=(10, 15, 20, alpha))
-    
-    bg = Image.alpha_composite(bg, overlay)
+    bg.alpha_composite(Image.fromarray(overlay, 'RGBA'))
     
     # Draw frame
     frame = Image.new('RGBA', (BANNER_WIDTH, BANNER_HEIGHT), (0, 0, 0, 0))
     draw_corner_frame(ImageDraw.Draw(frame), BANNER_WIDTH, BANNER_HEIGHT)
-    bg = Image.alpha_composite(bg, frame)
+    bg.alpha_composite(frame)
     
     # Load clean fonts (Arial/Calibri style - not scary)
     try:
-        font_title = ImageFont.truetype("C:/Windows/Fonts/calibrib.ttf", 72)
-        font_subtitle = ImageFont.truetype("C:/Windows/Fonts/calibril.ttf", 24)
-        font_welcome = ImageFont.truetype("C:/Windows/Fonts/calibrii.ttf", 22)
-        font_features = ImageFont.truetype("C:/Windows/Fonts/calibri.ttf", 18)
-        font_footer = ImageFont.truetype("C:/Windows/Fonts/calibril.ttf", 14)
+        font_title = load_font("C:/Windows/Fonts/calibrib.ttf", 72)
+        font_subtitle = load_font("C:/Windows/Fonts/calibril.ttf", 24)
+        font_welcome = load_font("C:/Windows/Fonts/calibrii.ttf", 22)
+        font_features = load_font("C:/Windows/Fonts/calibri.ttf", 18)
+        font_footer = load_font("C:/Windows/Fonts/calibril.ttf", 14)
     except:
         try:
-            font_title = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 72)
-            font_subtitle = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 24)
-            font_welcome = ImageFont.truetype("C:/Windows/Fonts/ariali.ttf", 22)
-            font_features = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 18)
-            font_footer = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 14)
+            font_title = load_font("C:/Windows/Fonts/arial.ttf", 72)
+            font_subtitle = load_font("C:/Windows/Fonts/arial.ttf", 24)
+            font_welcome = load_font("C:/Windows/Fonts/ariali.ttf", 22)
+            font_features = load_font("C:/Windows/Fonts/arial.ttf", 18)
+            font_footer = load_font("C:/Windows/Fonts/arial.ttf", 14)
         except:
             font_title = ImageFont.load_default()
             font_subtitle = font_title
@@ -123,21 +124,10 @@ def generate_welcome_banner():
     draw.text((title_x + 2, title_y + 2), wild, font=font_title, fill=(0, 0, 0, 60))
     draw.text((title_x, title_y), wild, font=font_title, fill=(255, 255, 255, 255))
     
-    # Draw "flover" - gradient character by character
+    # Draw "flover" - subtle shadow, then one gradient pass over the whole word
     flover_x = title_x + wild_w
-    char_x = flover_x
-    
-    for i, char in enumerate(flover):
-        ratio = i / max(len(flover) - 1, 1)
-        r = int(GRADIENT_START[0] + (GRADIENT_END[0] - GRADIENT_START[0]) * ratio)
-        g = int(GRADIENT_START[1] + (GRADIENT_END[1] - GRADIENT_START[1]) * ratio)
-        b = int(GRADIENT_START[2] + (GRADIENT_END[2] - GRADIENT_START[2]) * ratio)
-        
-        draw.text((char_x + 2, title_y + 2), char, font=font_title, fill=(0, 0, 0, 50))
-        draw.text((char_x, title_y), char, font=font_title, fill=(r, g, b, 255))
-        
-        char_bbox = draw.textbbox((0, 0), char, font=font_title)
-        char_x += char_bbox[2] - char_bbox[0]
+    draw.text((flover_x + 2, title_y + 2), flover, font=font_title, fill=(0, 0, 0, 50))
+    draw_gradient_text(bg, (flover_x, title_y), flover, font_title, GRADIENT_START, GRADIENT_END)
     
     # Subtitle
     subtitle = "League of Legends Skin Manager"
@@ -147,19 +137,18 @@ def generate_welcome_banner():
     
     draw.text((sub_x, sub_y), subtitle, font=font_subtitle, fill=(210, 215, 220, 255))
     
-    # Gradient divider
+    # Gradient divider - one row built in one pass, pasted over the pixels it replaces
     div_y = sub_y + 40
     div_w = 180
     div_x = (BANNER_WIDTH - div_w) // 2
     
-    for i in range(div_w):
-        dist = abs(i - div_w/2) / (div_w/2)
-        alpha = int(180 * (1 - dist))
-        ratio = i / div_w
-        r = int(GRADIENT_START[0] + (GRADIENT_END[0] - GRADIENT_START[0]) * ratio)
-        g = int(GRADIENT_START[1] + (GRADIENT_END[1] - GRADIENT_START[1]) * ratio)
-        b = int(GRADIENT_START[2] + (GRADIENT_END[2] - GRADIENT_START[2]) * ratio)
-        draw.point((div_x + i, div_y), fill=(r, g, b, alpha))
+    i = np.arange(div_w)
+    dist = np.abs(i - div_w/2) / (div_w/2)
+    ratio = i / div_w
+    divider = np.empty((1, div_w, 4), dtype=np.uint8)
+    divider[0, :, :3] = lerp_row(GRADIENT_START, GRADIENT_END, ratio)
+    divider[0, :, 3] = (180 * (1 - dist)).astype(np.uint8)
+    bg.paste(Image.fromarray(divider, 'RGBA'), (div_x, div_y))
     
     # Welcome text
     welcome = "Welcome to the Community"
@@ -181,9 +170,16 @@ def generate_welcome_banner():
     
     feature_y = wel_y + 55  # Start lower
     
+    icon = "—"  # Clean dash icon
+    spacing = "    "  # More space between dash and text
+    
+    # Icon and spacing widths are the same for every feature - measured once
+    icon_bbox = draw.textbbox((0, 0), icon, font=font_features)
+    icon_w = icon_bbox[2] - icon_bbox[0]
+    spacing_bbox = draw.textbbox((0, 0), spacing, font=font_features)
+    spacing_w = spacing_bbox[2] - spacing_bbox[0]
+    
     for feature in features:
-        icon = "—"  # Clean dash icon
-        spacing = "    "  # More space between dash and text
         text = f"{icon}{spacing}{feature}"
         
         txt_bbox = draw.textbbox((0, 0), text, font=font_features)
@@ -191,11 +187,6 @@ def generate_welcome_banner():
         feat_x = (BANNER_WIDTH - txt_w) // 2
         
         # Icon in accent color
-        icon_bbox = draw.textbbox((0, 0), icon, font=font_features)
-        icon_w = icon_bbox[2] - icon_bbox[0]
-        spacing_bbox = draw.textbbox((0, 0), spacing, font=font_features)
-        spacing_w = spacing_bbox[2] - spacing_bbox[0]
-        
         draw.text((feat_x, feature_y), icon, font=font_features, fill=ACCENT + (200,))
         draw.text((feat_x + icon_w + spacing_w, feature_y), feature, font=font_features, fill=(195, 200, 205, 255))
         
@@ -213,11 +204,14 @@ def generate_welcome_banner():
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'public', 'assets', 'discord')
     os.makedirs(output_dir, exist_ok=True)
     
+    # Alpha dropped once - both versions resample and encode from the same RGB pixels
+    banner_rgb = bg.convert('RGB')
+    
     out_path = os.path.join(output_dir, 'welcome_banner.png')
-    bg.convert('RGB').save(out_path, 'PNG', quality=95)
+    banner_rgb.save(out_path, 'PNG', compress_level=6)
     
     embed_path = os.path.join(output_dir, 'welcome_embed.png')
-    bg.resize((800, 420), Image.Resampling.LANCZOS).convert('RGB').save(embed_path, 'PNG', quality=90)
+    banner_rgb.resize((800, 420), Image.Resampling.LANCZOS, reducing_gap=3.0).save(embed_path, 'PNG', compress_level=6)
     
     print(f"[BANNER-GEN] Saved: {out_path}")
     print(f"[BANNER-GEN] Saved: {embed_path}")
@@ -0,0 +1,34 @@
+"""
+File: gradient.py
+Author: Wildflover
+Description: Colour gradient helper shared by the banner generators
+             - Whole gradients computed in one NumPy pass instead of per-pixel int() lerps
+             - Gradient text rendered once as a mask instead of character by character
+Language: Python 3.x
+Dependencies: Pillow (PIL), numpy
+"""
+
+from PIL import Image, ImageDraw
+import numpy as np
+
+
+def lerp_row(start, end, ratio):
+    """Colours along the start -> end gradient at each ratio as an (N, 3) uint8
+    array - truncated like int(), so rows match the per-pixel loops they replace"""
+    start = np.array(start, dtype=np.float64)
+    end = np.array(end, dtype=np.float64)
+    return (start + (end - start) * np.asarray(ratio, dtype=np.float64)[:, None]).astype(np.uint8)
+
+
+def draw_gradient_text(image, xy, text, font, start, end, alpha=255):
+    """Draw text filled with a left-to-right start -> end gradient - the string
+    is rendered once as a coverage mask and the gradient pasted through it,
+    blending the same way draw.text does on an RGBA canvas"""
+    _, _, width, height = font.getbbox(text)
+    mask = Image.new('L', (width, height), 0)
+    ImageDraw.Draw(mask).text((0, 0), text, font=font, fill=255)
+    
+    fill = np.empty((height, width, 4), dtype=np.uint8)
+    fill[..., :3] = lerp_row(start, end, np.arange(width) / max(width - 1, 1))
+    fill[..., 3] = alpha
+    image.paste(Image.fromarray(fill, 'RGBA'), (round(xy[0]), round(xy[1])), mask)
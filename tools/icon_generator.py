@@ -3,10 +3,11 @@ File: icon_generator.py
 Author: Wildflower
 Description: Multi-size icon generator with PNG and ICO output support
 Language: Python 3.x
-Dependencies: Pillow (PIL)
+Dependencies: Pillow (PIL), pyoxipng (optional)
 
 Usage:
     python icon_generator.py
+    python icon_generator.py --optimize    # Release build - oxipng recompression
 
 Features:
     - Converts JPG to PNG
@@ -15,8 +16,12 @@ Features:
     - High-quality resampling
 """
 
+import argparse
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
+from iconpipeline import build_pyramid, encode_png as encode_png_optimized
 
 # Configuration
 INPUT_FILE = "src-tauri/icons/256x256.png"
@@ -29,6 +34,9 @@ SIZES = [16, 32, 64, 128, 256, 512]
 # ICO sizes (Windows standard)
 ICO_SIZES = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
 
+# PNG zlib level for everyday builds - --optimize spends the extra CPU only for release artifacts
+PNG_COMPRESS_LEVEL = 6
+
 
 def create_directories():
     """Create output directories if they don't exist"""
@@ -37,72 +45,85 @@ def create_directories():
     print(f"[DIRECTORY:CREATE] Created output directories")
 
 
-def generate_png_icons(source_image):
-    """Generate PNG icons in multiple sizes"""
+def encode_png(image, optimize=False):
+    """Encode image to PNG bytes - zlib releases the GIL, so threads encode in parallel.
+    optimize goes through the shared iconpipeline encoder (oxipng keeping RGBA,
+    zlib level 9 when oxipng is missing)"""
+    if optimize:
+        return encode_png_optimized(image)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+def generate_png_icons(levels, optimize=False):
+    """Generate PNG icons in multiple sizes - returns the encoded {size: bytes}"""
     print(f"\n[ICON:GENERATE] Starting PNG generation")
     
-    for size in SIZES:
-        # Create resized image with high-quality resampling
-        resized = source_image.resize((size, size), Image.Resampling.LANCZOS)
-        
+    # Every size encoded in parallel
+    with ThreadPoolExecutor(max_workers=min(len(SIZES), os.cpu_count() or 1)) as executor:
+        encoded = dict(zip(SIZES, executor.map(encode_png, [levels[size] for size in SIZES], [optimize] * len(SIZES))))
+    
+    for size, data in encoded.items():
         # Save PNG
         output_path = os.path.join(OUTPUT_DIR, f"wildflower_{size}x{size}.png")
-        resized.save(output_path, "PNG", optimize=True)
+        with open(output_path, 'wb') as f:
+            f.write(data)
         
         print(f"[ICON:PNG] Generated {size}x{size} -> {output_path}")
         
-        # Copy specific sizes to Tauri icons directory
+        # Copy specific sizes to Tauri icons directory - same bytes, no second encode
         if size in [32, 128, 256]:
             tauri_path = os.path.join(TAURI_ICONS_DIR, f"{size}x{size}.png")
-            resized.save(tauri_path, "PNG", optimize=True)
+            with open(tauri_path, 'wb') as f:
+                f.write(data)
             print(f"[ICON:TAURI] Copied to {tauri_path}")
+    
+    return encoded
 
 
-def generate_ico_file(source_image):
+def generate_ico_file(levels):
     """Generate Windows ICO file with multiple sizes"""
     print(f"\n[ICON:ICO] Starting ICO generation")
     
-    # Create list of resized images for ICO
-    ico_images = []
-    for size in ICO_SIZES:
-        resized = source_image.resize(size, Image.Resampling.LANCZOS)
-        ico_images.append(resized)
+    # Resized images for ICO, taken from the shared size cascade
+    ico_images = [levels[width] for width, _ in ICO_SIZES]
     
-    # Save as ICO (Windows)
-    ico_path_public = os.path.join(OUTPUT_DIR, "wildflower.ico")
+    # Encode ICO (Windows) once for both copies
+    buffer = io.BytesIO()
     ico_images[0].save(
-        ico_path_public,
+        buffer,
         format="ICO",
         sizes=ICO_SIZES,
         append_images=ico_images[1:]
     )
+    data = buffer.getvalue()
+    
+    # Save as ICO
+    ico_path_public = os.path.join(OUTPUT_DIR, "wildflower.ico")
+    with open(ico_path_public, 'wb') as f:
+        f.write(data)
     print(f"[ICON:ICO] Generated multi-size ICO -> {ico_path_public}")
     
     # Copy to Tauri icons directory
     ico_path_tauri = os.path.join(TAURI_ICONS_DIR, "icon.ico")
-    ico_images[0].save(
-        ico_path_tauri,
-        format="ICO",
-        sizes=ICO_SIZES,
-        append_images=ico_images[1:]
-    )
+    with open(ico_path_tauri, 'wb') as f:
+        f.write(data)
     print(f"[ICON:ICO] Copied to {ico_path_tauri}")
 
 
-def generate_icon_png(source_image):
+def generate_icon_png(encoded):
     """Generate main icon.png for Tauri"""
     print(f"\n[ICON:MAIN] Generating main icon.png")
     
-    # Create 512x512 as main icon
-    main_icon = source_image.resize((512, 512), Image.Resampling.LANCZOS)
-    
-    # Save to Tauri icons
+    # 512x512 as main icon - the bytes generate_png_icons already encoded
     main_path = os.path.join(TAURI_ICONS_DIR, "icon.png")
-    main_icon.save(main_path, "PNG", optimize=True)
+    with open(main_path, 'wb') as f:
+        f.write(encoded[512])
     print(f"[ICON:MAIN] Generated 512x512 -> {main_path}")
 
 
-def main():
+def main(optimize=False):
     """Main execution function"""
     print("=" * 60)
     print("[SYSTEM:START] Wildflower Icon Generator v1.0.0")
@@ -119,7 +140,9 @@ def main():
     try:
         # Open source image
         with Image.open(INPUT_FILE) as img:
-            # Convert to RGB if necessary (remove alpha channel)
+            # Convert to RGB if necessary (remove alpha channel) - transparent areas
+            # are flattened onto white. build_pyramid converts back to RGBA, but that
+            # only adds the opaque alpha Tauri expects; the white fill is kept
             if img.mode in ('RGBA', 'LA', 'P'):
                 print(f"[CONVERT:MODE] Converting {img.mode} to RGB")
                 background = Image.new('RGB', img.size, (255, 255, 255))
@@ -135,14 +158,17 @@ def main():
             # Create directories
             create_directories()
             
+            # Resize once per size for every output - small sizes cascade from larger ones
+            levels = build_pyramid(img, SIZES + [width for width, _ in ICO_SIZES] + [512])
+            
             # Generate PNG icons
-            generate_png_icons(img)
+            encoded = generate_png_icons(levels, optimize)
             
             # Generate ICO file
-            generate_ico_file(img)
+            generate_ico_file(levels)
             
             # Generate main icon.png
-            generate_icon_png(img)
+            generate_icon_png(encoded)
             
             print("\n" + "=" * 60)
             print("[SYSTEM:SUCCESS] Icon generation completed")
@@ -159,4 +185,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Multi-size icon generator with PNG and ICO output")
+    parser.add_argument("--optimize", action="store_true",
+                        help="recompress PNGs with oxipng for release artifacts")
+    main(parser.parse_args().optimize)
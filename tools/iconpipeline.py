@@ -0,0 +1,336 @@
+"""
+File: iconpipeline.py
+Author: Wildflover
+Description: Shared icon pipeline for the ICO generator scripts
+             - Size pyramid built once per source and cached on disk (one file per source)
+             - Encoded PNG payloads cached per source hash and size
+             - Parallel PNG encoding with optional oxipng recompression
+             - Hand-rolled ICO writer (PNG entries, raw DIB for small sizes)
+Language: Python 3.x
+Dependencies: Pillow (PIL), pyoxipng (optional)
+"""
+
+from PIL import Image
+import PIL
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import multiprocessing
+import itertools
+import threading
+import tempfile
+import hashlib
+import struct
+import pickle
+import io
+import os
+from pathlib import Path
+
+try:
+    import oxipng
+except ImportError:
+    oxipng = None
+
+# [CONFIG] Cache locations - anchored on the repo root, not the working directory
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT_DIR / '.cache'
+PYRAMID_CACHE_DIR = CACHE_DIR / 'pyramids'
+ENCODED_CACHE_DIR = CACHE_DIR / 'icons'
+
+# Bump whenever downscale/build_pyramid or the PNG encoder change output -
+# it is part of every on-disk cache key, so stale pyramids and payloads miss
+PIPELINE_VERSION = 3
+
+# Encoder settings baked into cached payloads (see encode_png)
+ENCODER_ID = "oxipng-3-rgba" if oxipng is not None else "zlib-9"
+
+# [CONFIG] ICO entries up to this size are stored as raw DIB instead of PNG
+DIB_MAX_SIZE = 32
+
+# ICO header: Reserved, Type, Count
+_HDR = struct.Struct('<HHH')
+# ICO directory entry: Width, Height (0 = 256), Color palette (none), Reserved,
+# Color planes, Bits per pixel, Size of image data, Offset to image data
+_DIR = struct.Struct('<BBBBHHII')
+
+
+# ============================================================================
+# ENCODERS
+# ============================================================================
+
+# Scratch buffer reused by every encode on a thread - callers may encode from a thread pool
+_png_local = threading.local()
+
+
+def encode_png(img, compress_level=9):
+    """Encode image to PNG bytes, recompressed with oxipng when available;
+    compress_level only applies when oxipng is missing"""
+    _png_buffer = getattr(_png_local, 'buffer', None)
+    if _png_buffer is None:
+        _png_buffer = _png_local.buffer = io.BytesIO()
+    _png_buffer.seek(0)
+    _png_buffer.truncate()
+    if oxipng is None:
+        img.save(_png_buffer, format='PNG', compress_level=compress_level)
+        return bytes(_png_buffer.getbuffer())
+    # Fast initial encode - oxipng does the real compression work. Colour type
+    # reduction stays off: Tauri rejects icons that are not RGBA, even opaque ones
+    img.save(_png_buffer, format='PNG', compress_level=1)
+    return oxipng.optimize_from_memory(bytes(_png_buffer.getbuffer()), level=3,
+                                       strip=oxipng.StripChunks.safe(), color_type_reduction=False)
+
+
+def _encode_dib(img):
+    """Encode image as an uncompressed 32-bit DIB entry for small ICO sizes"""
+    width, height = img.size
+    # AND mask rows are padded to 32 bits; alpha channel makes it all zeros
+    mask_size = ((width + 31) // 32) * 4 * height
+    header = struct.pack('<IiiHHIIiiII',
+        40,                                 # Header size
+        width,                              # Width
+        height * 2,                         # Height (XOR + AND mask)
+        1,                                  # Color planes
+        32,                                 # Bits per pixel
+        0,                                  # Compression (BI_RGB)
+        width * height * 4 + mask_size,     # Size of image data
+        0, 0, 0, 0                          # Resolution / palette (unused)
+    )
+    # Pixels are stored bottom-up in BGRA order
+    return header + img.tobytes('raw', 'BGRA', 0, -1) + bytes(mask_size)
+
+
+def _encode_size(size, shm_name, offset):
+    """Encode one pyramid level to PNG - runs in a worker process and reads
+    the level in place from the shared pyramid block"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf[offset:offset + size * size * 4]
+        img = Image.frombuffer('RGBA', (size, size), view, 'raw', 'RGBA', 0, 1)
+        data = encode_png(img)
+        # Drop every reference into the block before detaching from it
+        del img
+        view.release()
+    finally:
+        shm.close()
+    return size, data
+
+
+# ============================================================================
+# CACHE FILES
+# ============================================================================
+
+def _write_atomic(path, data):
+    """Write data to path via a temp file in the same directory and os.replace,
+    so an interrupted run never leaves a truncated cache file behind"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# ============================================================================
+# SOURCE
+# ============================================================================
+
+def read_source(src_path):
+    """Read the source file once - returns (bytes, mtime) for the cache keys
+    and the decode. A missing source raises FileNotFoundError here, before
+    anything is written, so callers can probe candidate paths with it"""
+    with open(src_path, 'rb') as f:
+        return f.read(), os.fstat(f.fileno()).st_mtime
+
+
+# ============================================================================
+# PYRAMID
+# ============================================================================
+
+def downscale(img, size):
+    """LANCZOS resize to size x size; large ratios are first box-reduced in C
+    by an integer factor, leaving at least 2x for the LANCZOS step"""
+    factor_x = img.width // (2 * size)
+    factor_y = img.height // (2 * size)
+    if factor_x > 1 or factor_y > 1:
+        img = img.reduce((max(1, factor_x), max(1, factor_y)))
+    return img.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def build_pyramid(source, sizes):
+    """Resize source to every size - sizes at or above the source width straight
+    from the source, each smaller size from the previous (larger) level"""
+    if source.mode != 'RGBA':
+        source = source.convert('RGBA')
+
+    pyramid = {}
+    prev = source
+    for size in sorted(set(sizes), reverse=True):
+        if size >= source.width:
+            # Never cascade from an upscaled level
+            pyramid[size] = downscale(source, size)
+        else:
+            prev = pyramid[size] = downscale(prev, size)
+    return pyramid
+
+
+def load_pyramid(src_path, sizes, source=None):
+    """Return the size pyramid for src_path, reusing the on-disk cache while
+    the source mtime, sizes, pipeline and Pillow version are unchanged.
+    Each source has a single cache file, replaced whenever it goes stale"""
+    data, mtime = source if source is not None else read_source(src_path)
+    cache_path = os.path.join(PYRAMID_CACHE_DIR,
+                              hashlib.sha256(os.path.abspath(src_path).encode()).hexdigest()[:16] + '.pkl')
+    key = (mtime, tuple(sorted(sizes)), PIPELINE_VERSION, PIL.__version__)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            entry_key, pyramid = pickle.load(f)
+        if entry_key == key:
+            return pyramid
+    except Exception:
+        # Missing, truncated or written by another Pillow build - rebuild
+        pass
+
+    with Image.open(io.BytesIO(data)) as img:
+        pyramid = build_pyramid(img, sizes)
+
+    _write_atomic(cache_path, pickle.dumps((key, pyramid), protocol=pickle.HIGHEST_PROTOCOL))
+    return pyramid
+
+
+def encode_pngs(pyramid, sizes):
+    """Encode the given pyramid levels to PNG in parallel - zlib dominates.
+    Levels are packed into one shared memory block so workers map them
+    instead of receiving a pickled copy each"""
+    sizes = sorted(set(sizes))
+    if not sizes:
+        return {}
+
+    offsets = list(itertools.accumulate([0] + [s * s * 4 for s in sizes]))
+    shm = shared_memory.SharedMemory(create=True, size=offsets[-1])
+    try:
+        for size, offset in zip(sizes, offsets):
+            shm.buf[offset:offset + size * size * 4] = pyramid[size].tobytes()
+
+        # Spawned, not forked: oxipng's Rust thread pool does not survive fork(), so a
+        # forked worker deadlocks once the parent has encoded anything itself
+        with ProcessPoolExecutor(max_workers=min(len(sizes), os.cpu_count() or 1),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            return dict(executor.map(_encode_size, sizes, [shm.name] * len(sizes), offsets[:-1]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def load_encoded(src_path, pyramid, sizes, source=None):
+    """Return PNG payloads for the given sizes - payloads cached on disk for
+    the same source bytes, pipeline and pyramid are reused, only the missing
+    sizes are encoded"""
+    data, _ = source if source is not None else read_source(src_path)
+    key = hashlib.sha256(data)
+    # The cascade makes each level depend on every larger size in the pyramid
+    key.update(repr((PIPELINE_VERSION, PIL.__version__, ENCODER_ID, sorted(pyramid))).encode())
+    digest = key.hexdigest()[:16]
+
+    encoded = {}
+    for size in sizes:
+        try:
+            with open(os.path.join(ENCODED_CACHE_DIR, f"{digest}-{size}.png"), 'rb') as f:
+                encoded[size] = f.read()
+        except FileNotFoundError:
+            pass
+
+    fresh = encode_pngs(pyramid, [s for s in sizes if s not in encoded])
+    for size, data in fresh.items():
+        _write_atomic(os.path.join(ENCODED_CACHE_DIR, f"{digest}-{size}.png"), data)
+
+    encoded.update(fresh)
+    return encoded
+
+
+# ============================================================================
+# WRITERS
+# ============================================================================
+
+def write_pngs(pyramid, out_dir, sizes, encoded=None, tag="ICO"):
+    """Write {size}x{size}.png files for the given sizes"""
+    if encoded is None:
+        encoded = encode_pngs(pyramid, sizes)
+
+    os.makedirs(out_dir, exist_ok=True)
+    for size in sizes:
+        png_path = os.path.join(out_dir, f'{size}x{size}.png')
+        with open(png_path, 'wb') as f:
+            f.write(encoded[size])
+        print(f"[{tag}] PNG saved: {png_path}")
+
+
+def write_ico(pyramid, path, sizes, encoded=None, dib_max_size=DIB_MAX_SIZE, tag="ICO"):
+    """Pack the given sizes into a multi-size ICO file"""
+    if encoded is None:
+        encoded = encode_pngs(pyramid, [s for s in sizes if s > dib_max_size])
+
+    # Prepare image data - DIB for small sizes, PNG for the rest
+    image_data_list = []
+    for size in sizes:
+        data = _encode_dib(pyramid[size]) if size <= dib_max_size else encoded[size]
+        image_data_list.append(data)
+        print(f"[{tag}] Generated {size}x{size} ({len(data):,} bytes)")
+
+    # Offsets are known up front: payloads follow the header in entry order
+    header_size = _HDR.size + (_DIR.size * len(sizes))
+    lengths = [len(data) for data in image_data_list]
+    offsets = list(itertools.accumulate([header_size] + lengths[:-1]))
+
+    # Header and directory are packed into one preallocated buffer
+    header = bytearray(header_size)
+    _HDR.pack_into(header, 0, 0, 1, len(sizes))
+    for i, (size, length, offset) in enumerate(zip(sizes, lengths, offsets)):
+        dim = size if size < 256 else 0
+        _DIR.pack_into(header, _HDR.size + _DIR.size * i, dim, dim, 0, 0, 1, 32, length, offset)
+
+    with open(path, 'wb') as f:
+        f.write(header)
+
+        # Write image data
+        for data in image_data_list:
+            f.write(data)
+
+    file_size = header_size + sum(lengths)
+    print(f"[{tag}] ICO saved: {path} ({file_size:,} bytes)")
+    return file_size
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def build_icon_set(src_path, out_dir, sizes, ico_path, png_sizes=(32, 128, 256),
+                   icon_png=True, dib_max_size=DIB_MAX_SIZE, tag="ICO", source=None):
+    """Build PNG files, icon.png (256x256) and a multi-size ICO from one pyramid;
+    source is the read_source() result when the caller already read the file"""
+    if source is None:
+        source = read_source(src_path)
+    pyramid = load_pyramid(src_path, set(sizes) | set(png_sizes) | ({256} if icon_png else set()), source)
+    print(f"[{tag}] Source: {src_path}")
+
+    # One parallel encode covers the PNG files and every PNG entry of the ICO;
+    # warm rebuilds of an unchanged source skip it entirely
+    ico_png_sizes = [s for s in sizes if s > dib_max_size]
+    encoded = load_encoded(src_path, pyramid, set(ico_png_sizes) | set(png_sizes) | ({256} if icon_png else set()), source)
+
+    # ICO-only builds write nothing to out_dir - it may be '' for a bare ICO filename
+    if png_sizes or icon_png:
+        os.makedirs(out_dir, exist_ok=True)
+    if png_sizes:
+        write_pngs(pyramid, out_dir, png_sizes, encoded=encoded, tag=tag)
+
+    if icon_png:
+        icon_png_path = os.path.join(out_dir, 'icon.png')
+        with open(icon_png_path, 'wb') as f:
+            f.write(encoded[256])
+        print(f"[{tag}] PNG saved: {icon_png_path}")
+
+    return write_ico(pyramid, ico_path, sizes, encoded=encoded, dib_max_size=dib_max_size, tag=tag)
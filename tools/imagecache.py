@@ -0,0 +1,19 @@
+"""
+File: imagecache.py
+Author: Wildflover
+Description: Decoded source image cache shared by the icon scripts
+             - Each source is decoded and converted to RGBA once per process
+Language: Python 3.x
+Dependencies: Pillow (PIL)
+"""
+
+from PIL import Image
+import functools
+
+
+@functools.lru_cache(maxsize=8)
+def load_rgba(path):
+    """Open an image and convert it to RGBA - the result is shared between
+    callers, so treat it as read-only"""
+    with Image.open(path) as img:
+        return img.convert('RGBA')
@@ -72,26 +72,29 @@ def process_splash_image():
                 print(f"[RATIO-ORIGINAL] {original_ratio:.3f}")
                 print(f"[RATIO-TARGET] {target_ratio:.3f}")
                 
-                # Resize with aspect ratio preservation and crop
+                # Resize with aspect ratio preservation and crop - only the
+                # center crop is resampled, its box mapped back to source pixels
                 if original_ratio > target_ratio:
                     # Image is wider, fit height and crop width
                     new_height = TARGET_HEIGHT
                     new_width = int(original_width * (TARGET_HEIGHT / original_height))
-                    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
                     
                     # Crop center
                     left = (new_width - TARGET_WIDTH) // 2
-                    resized = resized.crop((left, 0, left + TARGET_WIDTH, TARGET_HEIGHT))
+                    scale = original_width / new_width
+                    box = (left * scale, 0, (left + TARGET_WIDTH) * scale, original_height)
+                    resized = img.resize((TARGET_WIDTH, TARGET_HEIGHT), Image.Resampling.LANCZOS, box=box)
                     print(f"[PROCESS-METHOD] Fit height, crop width (center)")
                 else:
                     # Image is taller, fit width and crop height
                     new_width = TARGET_WIDTH
                     new_height = int(original_height * (TARGET_WIDTH / original_width))
-                    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
                     
                     # Crop center
                     top = (new_height - TARGET_HEIGHT) // 2
-                    resized = resized.crop((0, top, TARGET_WIDTH, top + TARGET_HEIGHT))
+                    scale = original_height / new_height
+                    box = (0, top * scale, original_width, (top + TARGET_HEIGHT) * scale)
+                    resized = img.resize((TARGET_WIDTH, TARGET_HEIGHT), Image.Resampling.LANCZOS, box=box)
                     print(f"[PROCESS-METHOD] Fit width, crop height (center)")
                 
                 # Save processed image
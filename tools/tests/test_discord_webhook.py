@@ -0,0 +1,91 @@
+"""
+File: test_discord_webhook.py
+Author: Wildflover
+Description: Payload tests for the Discord webhook tool - the cached builder
+             must produce the same JSON the per-style send methods used to post
+Language: Python 3.x
+Dependencies: requests, colorama, pytest
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_webhook
+from discord_webhook import DiscordWebhook
+
+LINKS = ("https://example.com/direct", "https://example.com/mediafire",
+         "https://example.com/gdrive", "https://example.com/dropbox")
+BANNER_URL = "https://example.com/banner.png"
+
+TEXT_DESCRIPTION = (
+    "*League of Legends Skin Manager*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "`Wildflover` `Windows 10/11`\n\n"
+    "› **All Skins Unlocked** / Tüm Skinler Açık\n"
+    "› **Safe & Undetectable** / Güvenli & Tespit Edilemez\n"
+    "› **Auto Updates** / Otomatik Güncellemeler\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+)
+
+
+def _legacy_payload(style, banner_url, direct_url, mediafire_url, gdrive_url, dropbox_url):
+    """Payload dicts exactly as the original send_* methods spelled them out"""
+    fields = [
+        {"name": "Directly", "value": f"**[Click to Install]({direct_url})**", "inline": True},
+        {"name": "MediaFire", "value": f"**[Click to Install]({mediafire_url})**", "inline": True},
+        {"name": "Google Drive", "value": f"**[Click to Install]({gdrive_url})**", "inline": True},
+        {"name": "Dropbox", "value": f"**[Click to Install]({dropbox_url})**", "inline": True},
+    ]
+    footer = "Wildflover • Windows 10/11" if style == "minimal" else "Wildflover › Windows 10/11"
+    if style == "text":
+        embed = {"color": DiscordWebhook.COLOR_PINK, "title": "Wildflover",
+                 "description": TEXT_DESCRIPTION, "fields": fields, "footer": {"text": footer}}
+    else:
+        rule = "━" * (103 if style == "runeforge" else 34)
+        embed = {"color": DiscordWebhook.COLOR_PINK, "title": "UPDATE 0.0.3", "description": rule,
+                 "fields": fields, "image": {"url": banner_url}, "footer": {"text": footer}}
+    return {"username": "Wildflover", "embeds": [embed]}
+
+
+STYLES = [
+    ("install", BANNER_URL),
+    ("minimal", BANNER_URL),
+    ("text", None),
+    ("runeforge", BANNER_URL),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_payload_cache():
+    """_build_payload is lru-cached - keep serializer swaps from leaking between tests"""
+    DiscordWebhook._build_payload.cache_clear()
+    yield
+    DiscordWebhook._build_payload.cache_clear()
+
+
+@pytest.mark.parametrize("style, banner_url", STYLES)
+def test_build_payload_bytes_match_legacy_json(style, banner_url, monkeypatch):
+    """Without orjson the body is byte-for-byte what json.dumps(payload) used to post"""
+    monkeypatch.setattr(discord_webhook, 'orjson', None)
+    body = DiscordWebhook._build_payload(style, banner_url, *LINKS)
+    assert body == json.dumps(_legacy_payload(style, banner_url, *LINKS)).encode()
+
+
+@pytest.mark.parametrize("style, banner_url", STYLES)
+def test_build_payload_orjson_is_equivalent(style, banner_url):
+    """orjson output is compact UTF-8 but decodes to the same payload, keys in the same order"""
+    pytest.importorskip('orjson')
+    decoded = json.loads(DiscordWebhook._build_payload(style, banner_url, *LINKS))
+    legacy = _legacy_payload(style, banner_url, *LINKS)
+    assert decoded == legacy
+    assert json.dumps(decoded) == json.dumps(legacy)
+
+
+def test_build_payload_rejects_unknown_style():
+    with pytest.raises(ValueError):
+        DiscordWebhook._build_payload("banner", BANNER_URL, *LINKS)
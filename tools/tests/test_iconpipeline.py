@@ -0,0 +1,161 @@
+"""
+File: test_iconpipeline.py
+Author: Wildflover
+Description: Regression and round-trip tests for the shared icon pipeline
+Language: Python 3.x
+Dependencies: Pillow (PIL), pytest
+"""
+
+import io
+import os
+import struct
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import iconpipeline
+from iconpipeline import build_pyramid, downscale, encode_png, write_ico
+
+
+def test_encode_png_keeps_opaque_rgba():
+    """Opaque icons must stay RGBA - oxipng would otherwise reduce them to RGB or a palette"""
+    opaque_rgba = Image.new('RGBA', (32, 32), (200, 30, 40, 255))
+    opaque_rgba.putpixel((3, 3), (1, 2, 3, 255))
+    assert Image.open(io.BytesIO(encode_png(opaque_rgba))).mode == 'RGBA'
+
+
+def _gradient(size):
+    """Asymmetric RGBA test image - every channel runs in a different direction"""
+    ramp = Image.linear_gradient('L').resize((size, size))
+    return Image.merge('RGBA', (ramp, ramp.rotate(90), ramp.transpose(Image.Transpose.FLIP_LEFT_RIGHT),
+                                ramp.rotate(180)))
+
+
+def test_write_ico_round_trip(tmp_path):
+    """Header, directory offsets, the 256 -> 0 dimension byte and both entry formats"""
+    sizes = [16, 32, 48, 256]
+    pyramid = build_pyramid(_gradient(256), sizes)
+    path = tmp_path / 'icon.ico'
+    file_size = write_ico(pyramid, path, sizes, dib_max_size=32)
+    data = path.read_bytes()
+    assert file_size == len(data)
+
+    assert struct.unpack_from('<HHH', data, 0) == (0, 1, len(sizes))
+    expected_offset = 6 + 16 * len(sizes)
+    for i, size in enumerate(sizes):
+        width, height, palette, reserved, planes, bpp, length, offset = \
+            struct.unpack_from('<BBBBHHII', data, 6 + 16 * i)
+        assert (width, height) == ((0, 0) if size == 256 else (size, size))
+        assert (palette, reserved, planes, bpp) == (0, 0, 1, 32)
+        assert offset == expected_offset
+        expected_offset += length
+        payload = data[offset:offset + length]
+
+        if size <= 32:
+            # BITMAPINFOHEADER with doubled height, bottom-up BGRA pixels, zeroed AND mask
+            header_size, dib_width, dib_height, dib_planes, dib_bpp, compression = \
+                struct.unpack_from('<IiiHHI', payload, 0)
+            assert (header_size, dib_width, dib_height, dib_planes, dib_bpp, compression) == \
+                (40, size, size * 2, 1, 32, 0)
+            pixels = payload[40:40 + size * size * 4]
+            decoded = Image.frombytes('RGBA', (size, size), pixels, 'raw', 'BGRA', 0, -1)
+            assert decoded.tobytes() == pyramid[size].tobytes()
+            assert payload[40 + size * size * 4:] == bytes(((size + 31) // 32) * 4 * size)
+        else:
+            decoded = Image.open(io.BytesIO(payload))
+            assert decoded.format == 'PNG' and decoded.size == (size, size)
+            assert decoded.convert('RGBA').tobytes() == pyramid[size].tobytes()
+    assert expected_offset == len(data)
+
+
+def test_build_pyramid_never_cascades_from_upscaled_level():
+    """Sizes above the source width come straight from the source, and so does
+    the next smaller size - never from an upscaled level"""
+    source = _gradient(24)
+    pyramid = build_pyramid(source, [16, 32, 48])
+    for size in (16, 32, 48):
+        assert pyramid[size].tobytes() == downscale(source, size).tobytes()
+
+    # Below the source width each level still cascades from the previous one
+    pyramid = build_pyramid(_gradient(64), [16, 32])
+    assert pyramid[16].tobytes() == downscale(pyramid[32], 16).tobytes()
+
+
+def test_load_pyramid_cache_keys(tmp_path, monkeypatch):
+    """One cache file per source, rebuilt when sizes, mtime, version or the file itself change"""
+    monkeypatch.setattr(iconpipeline, 'PYRAMID_CACHE_DIR', tmp_path / 'pyramids')
+    builds = []
+    real_build = iconpipeline.build_pyramid
+    monkeypatch.setattr(iconpipeline, 'build_pyramid',
+                        lambda source, sizes: builds.append(sorted(sizes)) or real_build(source, sizes))
+    src = tmp_path / 'src.png'
+    _gradient(64).save(src)
+
+    first = iconpipeline.load_pyramid(str(src), [16, 32])
+    assert builds == [[16, 32]]
+    cached = iconpipeline.load_pyramid(str(src), [32, 16])
+    assert builds == [[16, 32]]
+    assert all(cached[s].tobytes() == first[s].tobytes() for s in (16, 32))
+
+    iconpipeline.load_pyramid(str(src), [16])
+    assert builds[-1] == [16]
+    # Stale entries are replaced, not accumulated
+    assert len(os.listdir(tmp_path / 'pyramids')) == 1
+
+    os.utime(src, (0, os.path.getmtime(src) + 10))
+    iconpipeline.load_pyramid(str(src), [16])
+    assert len(builds) == 3
+
+    monkeypatch.setattr(iconpipeline, 'PIPELINE_VERSION', iconpipeline.PIPELINE_VERSION + 1)
+    iconpipeline.load_pyramid(str(src), [16])
+    assert len(builds) == 4
+
+    # A truncated cache file is a miss, not an error
+    cache_file, = (tmp_path / 'pyramids').iterdir()
+    cache_file.write_bytes(b'junk')
+    iconpipeline.load_pyramid(str(src), [16])
+    assert len(builds) == 5
+    assert iconpipeline.load_pyramid(str(src), [16])[16].size == (16, 16)
+    assert len(builds) == 5
+
+
+def test_load_encoded_cache_keys(tmp_path, monkeypatch):
+    """Payloads are reused per source bytes and pyramid; only missing sizes are encoded"""
+    monkeypatch.setattr(iconpipeline, 'ENCODED_CACHE_DIR', tmp_path / 'icons')
+    encoded_sizes = []
+
+    def fake_encode_pngs(pyramid, sizes):
+        encoded_sizes.append(sorted(sizes))
+        return {size: b'png-%d-%d' % (size, len(encoded_sizes)) for size in sizes}
+    monkeypatch.setattr(iconpipeline, 'encode_pngs', fake_encode_pngs)
+
+    src = tmp_path / 'src.png'
+    _gradient(64).save(src)
+    pyramid = build_pyramid(_gradient(64), [16, 32, 64])
+
+    first = iconpipeline.load_encoded(str(src), pyramid, [32, 64])
+    assert encoded_sizes == [[32, 64]]
+    assert iconpipeline.load_encoded(str(src), pyramid, [32, 64]) == first
+    assert encoded_sizes[-1] == []
+
+    # Only the new size is encoded; cached ones come back unchanged
+    more = iconpipeline.load_encoded(str(src), pyramid, [16, 32, 64])
+    assert encoded_sizes[-1] == [16]
+    assert more[32] == first[32] and more[64] == first[64]
+
+    # Different source bytes, pyramid levels or encoder each miss
+    _gradient(64).rotate(90).save(src)
+    iconpipeline.load_encoded(str(src), pyramid, [32])
+    assert encoded_sizes[-1] == [32]
+
+    iconpipeline.load_encoded(str(src), build_pyramid(_gradient(64), [32, 64]), [32])
+    assert encoded_sizes[-1] == [32]
+
+    monkeypatch.setattr(iconpipeline, 'ENCODER_ID', 'other-encoder')
+    iconpipeline.load_encoded(str(src), pyramid, [32])
+    assert encoded_sizes[-1] == [32]
+
+    # No temp files left behind by the atomic writes
+    assert not [name for name in os.listdir(tmp_path / 'icons') if name.endswith('.tmp')]